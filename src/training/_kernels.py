@@ -0,0 +1,39 @@
+"""
+Numeric kernels for 1RM estimation.
+
+These are the unvalidated inner loops behind the public functions in one_rm.
+They are compiled with numba when it is installed and run as plain Python
+otherwise, so callers must validate inputs first.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; kernels then run as plain Python/NumPy
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def epley_tut_kernel(weight, reps, tut_per_rep, normal_tempo):
+    """TUT-adjusted Epley formula without validation (inputs must already be checked)."""
+    if reps == 0:
+        return weight
+    return weight * (1.0 + reps * (tut_per_rep / normal_tempo) / 30.0)
+
+
+@njit(parallel=True, cache=True)
+def epley_tut_batch_kernel(weights, reps, tut_per_rep, normal_tempo):
+    """Apply epley_tut_kernel to each row, in parallel when compiled by numba."""
+    out = np.empty(weights.shape[0], dtype=np.float64)
+    for i in prange(weights.shape[0]):
+        out[i] = epley_tut_kernel(weights[i], reps[i], tut_per_rep, normal_tempo)
+    return out
@@ -5,6 +5,31 @@ This module provides functions for calculating estimated 1RM from AMRAP performa
 with time-under-tension (TUT) adjustments.
 """
 
+import functools
+import math
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ._kernels import NUMBA_AVAILABLE, epley_tut_batch_kernel
+
+
+def _raise_invalid_input(
+    actual_reps: int,
+    tut_per_rep: float,
+    normal_tempo: float,
+    weight: float = 1.0
+) -> None:
+    """Raise ValueError naming the first invalid argument (weight, reps, then tempos)."""
+    if weight <= 0:
+        raise ValueError("weight must be positive")
+    if actual_reps < 0:
+        raise ValueError("actual_reps must be non-negative")
+    if tut_per_rep <= 0:
+        raise ValueError("tut_per_rep must be positive")
+    if normal_tempo <= 0:
+        raise ValueError("normal_tempo must be positive")
+
 
 def calculate_effective_reps(
     actual_reps: int,
@@ -29,12 +54,10 @@ def calculate_effective_reps(
         >>> calculate_effective_reps(10, tut_per_rep=6, normal_tempo=3)
         20.0  # 10 reps at 6s TUT = 20 effective reps at normal tempo
     """
-    if actual_reps < 0:
-        raise ValueError("actual_reps must be non-negative")
-    if tut_per_rep <= 0:
-        raise ValueError("tut_per_rep must be positive")
-    if normal_tempo <= 0:
-        raise ValueError("normal_tempo must be positive")
+    # Single fused check on the common (valid) path; the cold helper works out
+    # which argument failed
+    if actual_reps < 0 or tut_per_rep <= 0 or normal_tempo <= 0:
+        _raise_invalid_input(actual_reps, tut_per_rep, normal_tempo)
 
     # Calculate effective reps by scaling based on TUT ratio
     effective_reps = actual_reps * (tut_per_rep / normal_tempo)
@@ -46,12 +69,13 @@ def estimate_1rm_from_amrap(
     weight: float,
     actual_reps: int,
     tut_per_rep: float = 6.0,
-    normal_tempo: float = 3.0
+    normal_tempo: float = 3.0,
+    formula: str = "epley"
 ) -> float:
     """
-    Calculate estimated 1RM from AMRAP performance with TUT adjustment.
+    Calculate estimated 1RM from AMRAP performance.
 
-    Uses the Epley formula with TUT-adjusted effective reps:
+    By default uses the Epley formula with TUT-adjusted effective reps:
     1RM = weight × (1 + effective_reps / 30)
 
     Args:
@@ -59,10 +83,20 @@ def estimate_1rm_from_amrap(
         actual_reps: Number of reps completed
         tut_per_rep: Time under tension per rep in seconds (default 6s)
         normal_tempo: Baseline tempo in seconds (default 3s)
+        formula: "epley" (default), "brzycki" or "fitbod". Fitbod is fed the
+            TUT-adjusted effective reps like Epley; Brzycki is applied to the
+            actual reps, since doubled reps would run into its 37-rep
+            asymptote (so 37 or more actual reps raise ValueError). The tempo
+            arguments have no effect under Brzycki and must be left at their
+            defaults
 
     Returns:
         Estimated 1RM as a float
 
+    Raises:
+        ValueError: If inputs are invalid, formula is unknown, or tempos other
+            than the defaults are given with formula="brzycki"
+
     Example:
         >>> estimate_1rm_from_amrap(225, 10, tut_per_rep=6, normal_tempo=3)
         375.0  # 10 reps at 225lbs with 6s TUT = 20 effective reps = 375lbs 1RM
@@ -71,19 +105,229 @@ def estimate_1rm_from_amrap(
         - V2 will add validation flag for unrealistic estimates
         - Edge cases: 0 reps returns the weight itself
     """
-    if weight <= 0:
-        raise ValueError("weight must be positive")
-    if actual_reps < 0:
-        raise ValueError("actual_reps must be non-negative")
+    validate_formula(formula, tut_per_rep, normal_tempo)
+
+    if weight <= 0 or actual_reps < 0:
+        _raise_invalid_input(actual_reps, tut_per_rep, normal_tempo, weight)
 
     # Handle edge case: 0 reps means the weight is at or above 1RM
     if actual_reps == 0:
         return weight
 
-    # Convert to effective reps based on TUT
-    effective_reps = calculate_effective_reps(actual_reps, tut_per_rep, normal_tempo)
+    # Tempo checks come after the 0-rep short-circuit, matching the original
+    # calculate_effective_reps delegation
+    if tut_per_rep <= 0 or normal_tempo <= 0:
+        _raise_invalid_input(actual_reps, tut_per_rep, normal_tempo, weight)
+
+    # Convert to effective reps based on TUT (inlined calculate_effective_reps)
+    effective_reps = actual_reps * (tut_per_rep / normal_tempo)
+
+    if formula != "epley":
+        estimate = _FORMULAS[formula]
+        if formula == "brzycki":
+            return estimate(weight, actual_reps)
+        return estimate(weight, effective_reps)
 
     # Epley formula: 1RM = weight × (1 + reps / 30)
     estimated_1rm = weight * (1 + effective_reps / 30)
 
     return estimated_1rm
+
+
+@functools.lru_cache(maxsize=4096)
+def _k_of_weight(w_rounded: float) -> float:
+    """Fitbod log-weight denominator, cached per rounded weight."""
+    return -2.55 + 4.58 * math.log(w_rounded)
+
+
+def estimate_1rm_fitbod(weight: float, reps: float) -> float:
+    """
+    Estimate 1RM with the Fitbod log-weight formula.
+
+    1RM = weight × (1 + (reps - 1)^0.85 / (-2.55 + 4.58 × ln(weight)))
+
+    The log term is looked up by weight rounded to the nearest 0.5, since
+    gym loads land on plate increments.
+
+    Args:
+        weight: Weight lifted
+        reps: Number of (effective) reps completed
+
+    Returns:
+        Estimated 1RM as a float
+
+    Raises:
+        ValueError: If weight is not positive or too light (under ~1.75) for
+            the log term to be positive
+
+    Example:
+        >>> round(estimate_1rm_fitbod(225, 10), 1)
+        290.4
+    """
+    if weight <= 0:
+        raise ValueError("weight must be positive")
+    if reps <= 1:
+        return weight
+    w_rounded = round(weight * 2) / 2
+    # Weights under 0.25 round to 0, where the log is undefined
+    k = _k_of_weight(w_rounded) if w_rounded > 0 else 0.0
+    if k <= 0:
+        raise ValueError("weight is too light for the fitbod formula")
+    return weight * (1 + (reps - 1) ** 0.85 / k)
+
+
+def estimate_1rm_brzycki(weight: float, reps: float) -> float:
+    """
+    Estimate 1RM with the Brzycki formula.
+
+    1RM = weight × 36 / (37 - reps)
+
+    Args:
+        weight: Weight lifted
+        reps: Number of (effective) reps completed
+
+    Returns:
+        Estimated 1RM as a float
+
+    Raises:
+        ValueError: If weight is not positive or reps is 37 or more, where the
+            formula is undefined
+
+    Example:
+        >>> estimate_1rm_brzycki(275, 12)
+        396.0
+    """
+    if weight <= 0:
+        raise ValueError("weight must be positive")
+    if reps >= 37:
+        raise ValueError("reps must be below 37 for the brzycki formula")
+    return weight * 36 / (37 - reps)
+
+
+# Non-default formulas for estimate_1rm_from_amrap(), keyed by name (Epley is
+# computed inline there)
+_FORMULAS = {
+    "brzycki": estimate_1rm_brzycki,
+    "fitbod": estimate_1rm_fitbod,
+}
+
+
+def validate_formula(formula: str, tut_per_rep: float = 6.0, normal_tempo: float = 3.0) -> None:
+    """
+    Check a formula name and tempo arguments for estimate_1rm_from_amrap().
+
+    Args:
+        formula: Formula name ("epley", "brzycki" or "fitbod")
+        tut_per_rep: Time under tension per rep in seconds (default 6s)
+        normal_tempo: Baseline tempo in seconds (default 3s)
+
+    Raises:
+        ValueError: If formula is not one of the supported names, or if
+            "brzycki" (which uses the actual reps) is given non-default tempos
+    """
+    if formula != "epley" and formula not in _FORMULAS:
+        raise ValueError("formula must be one of: epley, brzycki, fitbod")
+    if formula == "brzycki" and (tut_per_rep != 6.0 or normal_tempo != 3.0):
+        raise ValueError("tut_per_rep and normal_tempo have no effect with the brzycki formula")
+
+
+def _validated_arrays(
+    weight: ArrayLike,
+    actual_reps: ArrayLike,
+    tut_per_rep: float,
+    normal_tempo: float
+):
+    """Convert batch inputs to NumPy arrays and apply the scalar validation rules."""
+    w = np.asarray(weight, dtype=np.float64)
+    r = np.asarray(actual_reps)
+
+    if (w <= 0).any():
+        raise ValueError("weight must be positive")
+    if (r < 0).any():
+        raise ValueError("actual_reps must be non-negative")
+    # As in the scalar version, tempos only matter (and are only checked) once
+    # some set has reps; an all-0-rep batch estimates the weights themselves
+    if (r > 0).any():
+        if tut_per_rep <= 0:
+            raise ValueError("tut_per_rep must be positive")
+        if normal_tempo <= 0:
+            raise ValueError("normal_tempo must be positive")
+
+    return w, r
+
+
+def estimate_1rm_from_amrap_vec(
+    weight: ArrayLike,
+    actual_reps: ArrayLike,
+    tut_per_rep: float = 6.0,
+    normal_tempo: float = 3.0
+) -> np.ndarray:
+    """
+    Vectorized estimate_1rm_from_amrap() for many sets at once.
+
+    Applies the same TUT-adjusted Epley formula element-wise with NumPy, so bulk
+    ingestion of historical sets runs in compiled array code rather than one
+    Python call per set.
+
+    Args:
+        weight: Weights lifted (scalar or array-like)
+        actual_reps: Reps completed for each weight (scalar or array-like)
+        tut_per_rep: Time under tension per rep in seconds (default 6s)
+        normal_tempo: Baseline tempo in seconds (default 3s)
+
+    Returns:
+        NumPy float64 array of estimated 1RMs
+
+    Example:
+        >>> estimate_1rm_from_amrap_vec([225, 315], [10, 0])
+        array([375., 315.])
+    """
+    w, r = _validated_arrays(weight, actual_reps, tut_per_rep, normal_tempo)
+    if not (r > 0).any():
+        # The tempos may be unchecked here, so skip the TUT term entirely
+        return np.broadcast_arrays(w, r)[0].copy()
+
+    # 0 reps means the weight is at or above 1RM, same as the scalar version
+    return np.where(r == 0, w, w * (1.0 + r * (tut_per_rep / normal_tempo) / 30.0))
+
+
+def estimate_1rm_from_amrap_batch_jit(
+    weights: ArrayLike,
+    actual_reps: ArrayLike,
+    tut_per_rep: float = 6.0,
+    normal_tempo: float = 3.0
+) -> np.ndarray:
+    """
+    Estimate 1RMs for a batch of sets with the numba-compiled kernel.
+
+    Intended for simulation code that sweeps many AMRAP outcomes (e.g., Monte
+    Carlo over rep distributions). Inputs are validated once for the whole
+    batch, then rows are processed in parallel native code. When numba is not
+    installed this falls back to estimate_1rm_from_amrap_vec().
+
+    Args:
+        weights: 1-D array-like of weights lifted
+        actual_reps: 1-D array-like of reps completed, same length as weights
+        tut_per_rep: Time under tension per rep in seconds (default 6s)
+        normal_tempo: Baseline tempo in seconds (default 3s)
+
+    Returns:
+        NumPy float64 array of estimated 1RMs
+
+    Example:
+        >>> estimate_1rm_from_amrap_batch_jit([225, 315], [10, 0])
+        array([375., 315.])
+    """
+    if not NUMBA_AVAILABLE:
+        return estimate_1rm_from_amrap_vec(weights, actual_reps, tut_per_rep, normal_tempo)
+
+    w, r = _validated_arrays(weights, actual_reps, tut_per_rep, normal_tempo)
+    if w.ndim != 1 or w.shape != r.shape:
+        raise ValueError("weights and actual_reps must be 1-D arrays of the same length")
+
+    return epley_tut_batch_kernel(
+        np.ascontiguousarray(w),
+        np.ascontiguousarray(r, dtype=np.float64),
+        float(tut_per_rep),
+        float(normal_tempo)
+    )
@@ -5,15 +5,95 @@ This module provides functions for generating weekly training plans with
 progressive overload and 1RM adjustments based on AMRAP performance.
 """
 
-from typing import Dict, List, Optional
+import dataclasses
+import functools
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
 from .one_rm import estimate_1rm_from_amrap
+from .program import TARGET_REPS, WEEK_IN_BLOCK, WEEK_TO_BLOCK_IDX, WEEK_TO_SETS
+
+
+# Default block percentages (immutable, shared by every call)
+_DEFAULT_BLOCK_PCTS = (
+    (0.7, 0.75, 0.8, 0.725),        # Block 1 (Weeks 1-4)
+    (0.775, 0.825, 0.85, 0.775),    # Block 2 (Weeks 5-8)
+    (0.8, 0.85, 0.875, 0.9, 0.65),  # Block 3 (Weeks 9-13)
+)
+
+# AMRAP weeks: weeks 2-4, 6-8, 10-12
+_AMRAP_WEEKS = frozenset({2, 3, 4, 6, 7, 8, 10, 11, 12})
+
+_WEEKS = range(1, 14)
+_WEEK_NUMBERS = frozenset(_WEEKS)
+
+_VALID_LIFTS = frozenset(TARGET_REPS)
+
+_REQUIRED_AMRAP_KEYS = frozenset({'weight', 'actual_reps'})
+
+_AMRAP_INSTRUCTION = "\nSPECIAL: Perform AMRAP (as many reps as possible) on the final set"
+
+# Program structure flattened to one entry per week (index 0 = week 1)
+_DEFAULT_PCTS = np.array([pct for block in _DEFAULT_BLOCK_PCTS for pct in block])
+_SETS = np.array(WEEK_TO_SETS[1:])
+_AMRAP_MASK = np.array([week in _AMRAP_WEEKS for week in _WEEKS])
+
+
+# eq=False keeps Mapping.__eq__, so a WeekPlan equals the dict with the same
+# fields. Not frozen: a frozen dataclass sets each field through
+# object.__setattr__, which made construction ~3x slower.
+@dataclasses.dataclass(slots=True, eq=False)
+class WeekPlan(Mapping):
+    """
+    Prescription for a single week of the training plan.
+
+    A slotted record: much smaller than a per-week dict and with faster
+    attribute access. It also implements the read-only Mapping
+    interface, so existing dict-style code (plan[week]['sets']) keeps working
+    and a WeekPlan compares equal to the dict of its fields; use asdict() when
+    a real dict is needed (e.g., for JSON).
+
+    Attributes:
+        prescribed_weight: Weight to use for training
+        percentage: Percentage of current 1RM
+        current_1rm: 1RM at start of this week
+        sets: Number of sets to perform
+        is_amrap_week: Whether to perform AMRAP this week
+    """
+
+    prescribed_weight: float
+    percentage: float
+    current_1rm: float
+    sets: int
+    is_amrap_week: bool
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _WEEK_PLAN_KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_WEEK_PLAN_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_WEEK_PLAN_FIELDS)
+
+    def asdict(self) -> Dict[str, Any]:
+        """Return the week's prescription as a plain dict."""
+        return dataclasses.asdict(self)
+
+
+_WEEK_PLAN_FIELDS = tuple(field.name for field in dataclasses.fields(WeekPlan))
+_WEEK_PLAN_KEYS = frozenset(_WEEK_PLAN_FIELDS)
 
 
 def build_training_plan(
     start_1rm: float,
-    block_percentages: Optional[List[List[float]]] = None,
+    block_percentages: Optional[Sequence[Sequence[float]]] = None,
     amrap_results: Optional[Dict[int, Dict[str, float]]] = None
-) -> Dict[int, Dict[str, float]]:
+) -> Dict[int, WeekPlan]:
     """
     Generate 13-week training plan with progressive overload.
 
@@ -23,7 +103,7 @@ def build_training_plan(
 
     Args:
         start_1rm: Initial 1RM for the lift in pounds/kg
-        block_percentages: List of lists containing percentages for each block.
+        block_percentages: List (or tuple) of lists containing percentages for each block.
                           Default:
                             Block 1 (Weeks 1-4): [0.7, 0.75, 0.8, 0.725]
                             Block 2 (Weeks 5-8): [0.775, 0.825, 0.85, 0.775]
@@ -34,22 +114,19 @@ def build_training_plan(
                       If not provided, assumes no AMRAP data available yet.
 
     Returns:
-        Dictionary with weekly prescription data:
-        {
-            week_number: {
-                'prescribed_weight': float,  # Weight to use for training
-                'percentage': float,          # Percentage of current 1RM
-                'current_1rm': float,         # 1RM at start of this week
-                'sets': int,                  # Number of sets to perform
-                'is_amrap_week': bool         # Whether to perform AMRAP this week
-            }
-        }
+        Dictionary mapping week number to a WeekPlan with fields:
+            prescribed_weight (float): Weight to use for training
+            percentage (float):        Percentage of current 1RM
+            current_1rm (float):       1RM at start of this week
+            sets (int):                Number of sets to perform
+            is_amrap_week (bool):      Whether to perform AMRAP this week
+        Fields can be read as attributes (plan[1].sets) or by key (plan[1]['sets']).
 
     Example:
         >>> plan = build_training_plan(300.0)
         >>> plan[1]
-        {'prescribed_weight': 210.0, 'percentage': 0.7, 'current_1rm': 300.0,
-         'sets': 3, 'is_amrap_week': False}
+        WeekPlan(prescribed_weight=210.0, percentage=0.7, current_1rm=300.0,
+                 sets=3, is_amrap_week=False)
 
     Notes:
         - AMRAP weeks are weeks 2-4, 6-8, and 10-12 (3 consecutive weeks per block)
@@ -61,98 +138,95 @@ def build_training_plan(
     if start_1rm <= 0:
         raise ValueError("start_1rm must be positive")
 
-    # Default block percentages if not provided
-    if block_percentages is None:
-        block_percentages = [
-            [0.7, 0.75, 0.8, 0.725],      # Block 1 (Weeks 1-4)
-            [0.775, 0.825, 0.85, 0.775],  # Block 2 (Weeks 5-8)
-            [0.8, 0.85, 0.875, 0.9, 0.65] # Block 3 (Weeks 9-13)
-        ]
-
-    # Validate block percentages structure
-    if len(block_percentages) != 3:
-        raise ValueError("block_percentages must contain exactly 3 blocks")
-    if len(block_percentages[0]) != 4 or len(block_percentages[1]) != 4 or len(block_percentages[2]) != 5:
-        raise ValueError("block_percentages must have 4, 4, and 5 weeks respectively")
-
-    # Initialize amrap_results if not provided
-    if amrap_results is None:
-        amrap_results = {}
-
-    # AMRAP weeks: weeks 2-4, 6-8, 10-12
-    amrap_weeks = {2, 3, 4, 6, 7, 8, 10, 11, 12}
-
-    # Progressive volume: 3 sets (weeks 1-4), 4 sets (weeks 5-8), 5 sets (weeks 9-13)
-    def get_sets_for_week(week: int) -> int:
-        if week <= 4:
-            return 3
-        elif week <= 8:
-            return 4
-        else:
-            return 5
-
-    # Build the training plan week by week
-    training_plan = {}
-    current_1rm = start_1rm
-
-    for week in range(1, 14):  # Weeks 1-13
-        # Determine which block and week within block
-        if week <= 4:
-            block_idx = 0
-            week_in_block = week - 1
-        elif week <= 8:
-            block_idx = 1
-            week_in_block = week - 5
-        else:
-            block_idx = 2
-            week_in_block = week - 9
-
-        # Get percentage for this week
-        percentage = block_percentages[block_idx][week_in_block]
-
-        # Calculate prescribed weight
-        prescribed_weight = current_1rm * percentage
-
-        # Get sets for this week
-        sets = get_sets_for_week(week)
-
-        # Check if this is an AMRAP week
-        is_amrap_week = week in amrap_weeks
-
-        # Store weekly prescription
-        training_plan[week] = {
-            'prescribed_weight': prescribed_weight,
-            'percentage': percentage,
-            'current_1rm': current_1rm,
-            'sets': sets,
-            'is_amrap_week': is_amrap_week
+    # Fast path: the default program without AMRAP data is linear in start_1rm,
+    # so scale the cached 1.0 template instead of rebuilding the plan. Fields
+    # are read as attributes and passed positionally (in field order), which
+    # is several times cheaper than key lookups and keyword arguments
+    if block_percentages is None and not amrap_results:
+        return {
+            week: WeekPlan(
+                week_data.prescribed_weight * start_1rm,
+                week_data.percentage,
+                week_data.current_1rm * start_1rm,
+                week_data.sets,
+                week_data.is_amrap_week
+            )
+            for week, week_data in _unit_plan_template().items()
         }
 
-        # Update 1RM based on AMRAP results from this week (applied to next week)
-        if week in amrap_results:
-            amrap_data = amrap_results[week]
-
-            # Validate AMRAP data format
-            required_keys = {'weight', 'actual_reps'}
-            if not required_keys.issubset(amrap_data.keys()):
-                raise ValueError(f"AMRAP data for week {week} must contain 'weight' and 'actual_reps'")
-
-            # Extract AMRAP parameters
-            weight = amrap_data['weight']
-            actual_reps = amrap_data['actual_reps']
-            tut_per_rep = amrap_data.get('tut_per_rep', 6.0)
-            normal_tempo = amrap_data.get('normal_tempo', 3.0)
-
-            # Calculate new 1RM from AMRAP performance
-            new_1rm = estimate_1rm_from_amrap(
-                weight=weight,
-                actual_reps=actual_reps,
-                tut_per_rep=tut_per_rep,
-                normal_tempo=normal_tempo
-            )
+    return _build_plan(start_1rm, block_percentages, amrap_results)
+
 
-            # Update current 1RM for subsequent weeks
-            current_1rm = new_1rm
+@functools.lru_cache(maxsize=1)
+def _unit_plan_template() -> Dict[int, WeekPlan]:
+    """Default plan for a 1RM of 1.0 (internal; never hand the dict out directly)."""
+    return _build_plan(1.0, None, None)
+
+
+def _build_plan(
+    start_1rm: float,
+    block_percentages: Optional[Sequence[Sequence[float]]],
+    amrap_results: Optional[Dict[int, Dict[str, float]]]
+) -> Dict[int, WeekPlan]:
+    """Build the full plan; see build_training_plan() for arguments and output."""
+    # Default block percentages if not provided
+    if block_percentages is None:
+        percentages = _DEFAULT_PCTS
+    else:
+        # Validate block percentages structure
+        if not isinstance(block_percentages, (list, tuple)):
+            raise ValueError("block_percentages must be a list or tuple of blocks")
+        if len(block_percentages) != 3:
+            raise ValueError("block_percentages must contain exactly 3 blocks")
+        if len(block_percentages[0]) != 4 or len(block_percentages[1]) != 4 or len(block_percentages[2]) != 5:
+            raise ValueError("block_percentages must have 4, 4, and 5 weeks respectively")
+
+        # Flatten the three blocks into one percentage per week
+        percentages = np.array(
+            [block_percentages[WEEK_TO_BLOCK_IDX[week]][WEEK_IN_BLOCK[week]] for week in _WEEKS],
+            dtype=np.float64
+        )
+
+    # AMRAP weeks that actually have results are checkpoints; validate them all
+    # up front so the update walk below only touches those k entries
+    checkpoints = sorted(_WEEK_NUMBERS.intersection(amrap_results)) if amrap_results else []
+    for week in checkpoints:
+        if not _REQUIRED_AMRAP_KEYS.issubset(amrap_results[week]):
+            raise ValueError(f"AMRAP data for week {week} must contain 'weight' and 'actual_reps'")
+
+    # 1RM in effect for each week; each checkpoint overwrites the 1RM for all
+    # following weeks
+    current_1rms = np.full(13, start_1rm, dtype=np.float64)
+    for week in checkpoints:
+        amrap_data = amrap_results[week]
+
+        # Calculate new 1RM from AMRAP performance
+        new_1rm = estimate_1rm_from_amrap(
+            weight=amrap_data['weight'],
+            actual_reps=amrap_data['actual_reps'],
+            tut_per_rep=amrap_data.get('tut_per_rep', 6.0),
+            normal_tempo=amrap_data.get('normal_tempo', 3.0)
+        )
+
+        # Update current 1RM for subsequent weeks (week is 1-based, so this
+        # slice starts at the following week)
+        current_1rms[week:] = new_1rm
+
+    # Calculate prescribed weights for all 13 weeks in one operation
+    prescribed_weights = current_1rms * percentages
+
+    # Build the training plan from the per-week arrays
+    training_plan = {
+        week: WeekPlan(*week_fields)
+        for week, *week_fields in zip(
+            _WEEKS,
+            prescribed_weights.tolist(),
+            percentages.tolist(),
+            current_1rms.tolist(),
+            _SETS.tolist(),
+            _AMRAP_MASK.tolist()
+        )
+    }
 
     return training_plan
 
@@ -160,8 +234,8 @@ def build_training_plan(
 def suggest_next_week_workout(
     current_week: int,
     lift_name: str,
-    training_plan: Dict[int, Dict[str, float]]
-) -> Dict[str, any]:
+    training_plan: Dict[int, WeekPlan]
+) -> Dict[str, Any]:
     """
     Generate specific workout prescription for the upcoming week.
 
@@ -172,6 +246,7 @@ def suggest_next_week_workout(
         current_week: Week number to generate prescription for (1-13)
         lift_name: Which lift ("Squat", "Bench Press", "Pull-ups")
         training_plan: Output from build_training_plan() containing weekly prescriptions
+                       (plain dicts per week, e.g. from WeekPlan.asdict(), also work)
 
     Returns:
         Dictionary with workout prescription:
@@ -204,46 +279,94 @@ def suggest_next_week_workout(
         - Sets progression: 3 (Block 1) → 4 (Block 2) → 5 (Block 3)
         - AMRAP instructions included for weeks 2-4, 6-8, 10-12
     """
-    # Validate week
+    week_data = _lookup_week(current_week, training_plan)
+
+    # Validate lift name
+    if lift_name not in _VALID_LIFTS:
+        raise ValueError(f"lift_name must be one of: {', '.join(TARGET_REPS)}")
+
+    return _build_workout(current_week, lift_name, week_data, *_week_lines(week_data))
+
+
+def suggest_next_week_workouts_all(
+    current_week: int,
+    training_plan: Dict[int, WeekPlan]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Generate workout prescriptions for every lift in the upcoming week.
+
+    Equivalent to calling suggest_next_week_workout() once per lift, but the
+    week lookup and the weight/AMRAP lines are shared across lifts.
+
+    Args:
+        current_week: Week number to generate prescriptions for (1-13)
+        training_plan: Output from build_training_plan() containing weekly prescriptions
+                       (plain dicts per week, e.g. from WeekPlan.asdict(), also work)
+
+    Returns:
+        Dictionary mapping each lift name ("Squat", "Bench Press", "Pull-ups") to
+        the prescription suggest_next_week_workout() returns for it
+
+    Raises:
+        ValueError: If current_week is not in range 1-13 or not in training_plan
+
+    Example:
+        >>> plan = build_training_plan(start_1rm=300.0)
+        >>> workouts = suggest_next_week_workouts_all(2, plan)
+        >>> workouts["Pull-ups"]['target_reps']
+        '10-15'
+    """
+    week_data = _lookup_week(current_week, training_plan)
+    weight_line, amrap_line = _week_lines(week_data)
+    return {
+        lift_name: _build_workout(current_week, lift_name, week_data, weight_line, amrap_line)
+        for lift_name in TARGET_REPS
+    }
+
+
+def _lookup_week(current_week: int, training_plan: Dict[int, WeekPlan]) -> Mapping:
+    """Validate current_week against the plan and return that week's prescription."""
     if not 1 <= current_week <= 13:
         raise ValueError("current_week must be between 1 and 13")
 
     if current_week not in training_plan:
         raise ValueError(f"Week {current_week} not found in training_plan")
 
-    # Validate lift name
-    valid_lifts = ["Squat", "Bench Press", "Pull-ups"]
-    if lift_name not in valid_lifts:
-        raise ValueError(f"lift_name must be one of: {', '.join(valid_lifts)}")
+    return training_plan[current_week]
 
-    # Get week prescription from training plan
-    week_data = training_plan[current_week]
-    prescribed_weight = week_data['prescribed_weight']
-    sets = week_data['sets']
-    is_amrap_week = week_data['is_amrap_week']
 
-    # Determine target rep range based on lift type
-    if lift_name == "Pull-ups":
-        target_reps = "10-15"
-    else:  # Squat or Bench Press
-        target_reps = "9-12"
+def _week_lines(week_data: Mapping) -> Tuple[str, str]:
+    """Format the lift-independent weight and AMRAP instruction lines."""
+    weight_line = f"Weight: {week_data['prescribed_weight']:.1f} lbs\n"
+    amrap_line = _AMRAP_INSTRUCTION if week_data['is_amrap_week'] else ""
+    return weight_line, amrap_line
 
-    # Build instructions
-    instructions = f"Week {current_week} - {lift_name} Workout\n"
-    instructions += f"Sets: {sets} sets\n"
-    instructions += f"Reps: {target_reps} reps per set\n"
-    instructions += f"Weight: {prescribed_weight:.1f} lbs\n"
 
-    if is_amrap_week:
-        instructions += f"\nSPECIAL: Perform AMRAP (as many reps as possible) on the final set"
+def _build_workout(
+    current_week: int,
+    lift_name: str,
+    week_data: Mapping,
+    weight_line: str,
+    amrap_line: str
+) -> Dict[str, Any]:
+    """Assemble one lift's prescription from pre-formatted week lines."""
+    target_reps = TARGET_REPS[lift_name]
+    sets = week_data['sets']
+
+    instructions = (
+        f"Week {current_week} - {lift_name} Workout\n"
+        f"Sets: {sets} sets\n"
+        f"Reps: {target_reps} reps per set\n"
+        f"{weight_line}"
+        f"{amrap_line}"
+    )
 
-    # Return workout prescription
     return {
         'week': current_week,
         'lift': lift_name,
         'sets': sets,
         'target_reps': target_reps,
-        'weight': prescribed_weight,
-        'is_amrap_week': is_amrap_week,
+        'weight': week_data['prescribed_weight'],
+        'is_amrap_week': week_data['is_amrap_week'],
         'instructions': instructions
     }
@@ -0,0 +1,17 @@
+"""
+Program Structure Module
+
+Shared tables describing the 13-week program layout, used by both the planner
+and the performance tracker.
+"""
+
+from typing import Dict, Optional, Tuple
+
+# Week -> block index, week within block and sets, indexed by week number
+# (index 0 is unused). Sets step 3 -> 4 -> 5 per block.
+WEEK_TO_BLOCK_IDX: Tuple[Optional[int], ...] = (None, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2, 2)
+WEEK_IN_BLOCK: Tuple[Optional[int], ...] = (None, 0, 1, 2, 3, 0, 1, 2, 3, 0, 1, 2, 3, 4)
+WEEK_TO_SETS: Tuple[Optional[int], ...] = (None, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 5, 5)
+
+# Target rep range per lift (also defines the valid lift names, in display order)
+TARGET_REPS: Dict[str, str] = {"Squat": "9-12", "Bench Press": "9-12", "Pull-ups": "10-15"}
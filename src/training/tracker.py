@@ -5,10 +5,53 @@ This module provides functions for tracking training performance data throughout
 the 13-week program. Uses pandas DataFrame for efficient data storage and analysis.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Optional, Union
+from typing import Any, Dict, IO, List, Optional, Set, Tuple, Union
+from numpy.typing import ArrayLike
 from pathlib import Path
-from .one_rm import estimate_1rm_from_amrap
+from .one_rm import estimate_1rm_from_amrap, estimate_1rm_from_amrap_vec, validate_formula
+from .program import TARGET_REPS, WEEK_TO_BLOCK_IDX
+
+
+# Performance log schema, in column order
+_COLUMNS = ['week', 'block', 'lift', 'weight', 'reps', 'total_tut', 'rpe', 'estimated_1rm']
+
+# Compact storage dtype for each column
+_DTYPES = {
+    'week': 'int8',
+    'block': 'int8',
+    'lift': 'category',
+    'weight': 'float32',
+    'reps': 'int16',
+    'total_tut': 'float32',
+    'rpe': 'float32',
+    'estimated_1rm': 'float32'
+}
+
+# Largest rep count the reps column can store
+_MAX_REPS = int(np.iinfo(_DTYPES['reps']).max)
+
+# Categorical dtype for the lift column of a fresh log: the programmed lifts,
+# extended on append when another lift is logged
+_LIFT_DTYPE = pd.CategoricalDtype(list(TARGET_REPS))
+
+# Columns build_performance_index() can partition a log on
+_INDEX_COLUMNS = ('lift', 'week', 'block')
+
+# User-supplied fields of a logged set, in log_performance() argument order
+_RECORD_FIELDS = ('week', 'lift', 'weight', 'reps', 'total_tut', 'rpe')
+
+# Block number indexed by week number (index 0 is unused), for array lookups
+_WEEK_TO_BLOCK = np.array([0] + [idx + 1 for idx in WEEK_TO_BLOCK_IDX[1:]], dtype=np.int8)
+
+
+def _block_of_week(week: int) -> int:
+    """Block number of a validated week; integral floats (e.g. 2.0 from CSV/JSON) are accepted."""
+    try:
+        return WEEK_TO_BLOCK_IDX[week] + 1
+    except TypeError:
+        return WEEK_TO_BLOCK_IDX[int(week)] + 1
 
 
 def get_block_from_week(week: int) -> int:
@@ -22,7 +65,7 @@ def get_block_from_week(week: int) -> int:
         Block number (1, 2, or 3)
 
     Raises:
-        ValueError: If week is not in range 1-13
+        ValueError: If week is not in range 1-13 or not a whole number
 
     Example:
         >>> get_block_from_week(1)
@@ -34,13 +77,37 @@ def get_block_from_week(week: int) -> int:
     """
     if not 1 <= week <= 13:
         raise ValueError("week must be between 1 and 13")
+    if week % 1 != 0:
+        raise ValueError("week must be a whole number")
+
+    return _block_of_week(week)
 
-    if week <= 4:
-        return 1
-    elif week <= 8:
-        return 2
-    else:
-        return 3
+
+def block_from_week_vec(weeks: ArrayLike) -> np.ndarray:
+    """
+    Vectorized get_block_from_week() for an array of week numbers.
+
+    Gathers from a precomputed week -> block table, so the whole array is
+    mapped with a single index operation and no per-element branching.
+
+    Args:
+        weeks: Array-like of week numbers (1-13)
+
+    Returns:
+        NumPy int8 array of block numbers (1, 2, or 3)
+
+    Raises:
+        ValueError: If any week is not in range 1-13
+
+    Example:
+        >>> block_from_week_vec([1, 5, 9, 13])
+        array([1, 2, 3, 3], dtype=int8)
+    """
+    weeks = np.asarray(weeks)
+    if ((weeks < 1) | (weeks > 13)).any():
+        raise ValueError("week must be between 1 and 13")
+
+    return _WEEK_TO_BLOCK[weeks.astype(np.intp, copy=False)]
 
 
 def initialize_performance_log() -> pd.DataFrame:
@@ -49,97 +116,181 @@ def initialize_performance_log() -> pd.DataFrame:
 
     Returns:
         Empty pandas DataFrame with columns for tracking training performance:
-        - week (int): Week number (1-13)
-        - block (int): Block number (1-3)
-        - lift (str): Lift name (e.g., "Squat", "Bench Press", "Pull-ups")
-        - weight (float): Actual weight used in pounds/kg
-        - reps (int): Number of reps completed
-        - total_tut (float): Total time under tension for the set in seconds
-        - rpe (float): Rate of Perceived Exertion (1-10 scale)
-        - estimated_1rm (float): Calculated 1RM from that performance
+        - week (int8): Week number (1-13)
+        - block (int8): Block number (1-3)
+        - lift (category): Lift name (e.g., "Squat", "Bench Press", "Pull-ups");
+          other lift names are added as categories when logged
+        - weight (float32): Actual weight used in pounds/kg
+        - reps (int16): Number of reps completed
+        - total_tut (float32): Total time under tension for the set in seconds
+        - rpe (float32): Rate of Perceived Exertion (1-10 scale)
+        - estimated_1rm (float32): Calculated 1RM from that performance
 
     Example:
         >>> df = initialize_performance_log()
         >>> df.columns.tolist()
         ['week', 'block', 'lift', 'weight', 'reps', 'total_tut', 'rpe', 'estimated_1rm']
     """
-    return pd.DataFrame(columns=[
-        'week',
-        'block',
-        'lift',
-        'weight',
-        'reps',
-        'total_tut',
-        'rpe',
-        'estimated_1rm'
-    ])
+    return pd.DataFrame({
+        column: pd.Series(dtype=_LIFT_DTYPE if column == 'lift' else _DTYPES[column])
+        for column in _COLUMNS
+    })
 
 
-def log_performance(
-    df: pd.DataFrame,
+def _merged_lift_dtype(lift_dtype: pd.CategoricalDtype, lifts: Any) -> pd.CategoricalDtype:
+    """Return lift_dtype extended with any of `lifts` it does not already contain."""
+    known = set(lift_dtype.categories)
+    missing = [lift for lift in pd.unique(np.asarray(lifts, dtype=object)) if lift not in known]
+    if not missing:
+        return lift_dtype
+    return pd.CategoricalDtype([*lift_dtype.categories, *missing])
+
+
+def _append_rows(df: pd.DataFrame, rows: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Concatenate new rows, given as column -> values, onto a performance log.
+
+    When `df` stores lift as a category, the new columns are built directly in the
+    log's dtypes (with any unseen lifts added as categories) so the concat does
+    not fall back to object/int64/float64 columns. Untyped logs are concatenated
+    as-is.
+    """
+    lift_dtype = df['lift'].dtype
+    if not isinstance(lift_dtype, pd.CategoricalDtype):
+        return pd.concat([df, pd.DataFrame(rows, columns=_COLUMNS)], ignore_index=True)
+
+    # Join column by column: NumPy columns are concatenated with the new values
+    # cast straight to their dtype (no cast when they already match) and the lift
+    # column by category code, which is several times cheaper than pd.concat
+    # reconciling categorical dtypes
+    lift_dtype = _merged_lift_dtype(lift_dtype, rows['lift'])
+    columns = {}
+    for column, series in df.items():
+        dtype = series.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            if column == 'lift':
+                dtype = lift_dtype
+            codes = pd.Categorical(rows[column], dtype=dtype).codes
+            columns[column] = pd.Categorical.from_codes(
+                np.concatenate([series.cat.codes.to_numpy(), codes]), dtype=dtype
+            )
+        else:
+            columns[column] = np.concatenate([series.to_numpy(), np.asarray(rows[column], dtype=dtype)])
+
+    return pd.DataFrame(columns, copy=False)
+
+
+def _validate_record(
     week: int,
     lift: str,
     weight: float,
     reps: int,
     total_tut: float,
-    rpe: float,
-    tut_per_rep: float = 6.0,
-    normal_tempo: float = 3.0
-) -> pd.DataFrame:
+    rpe: float
+) -> None:
     """
-    Add a new performance record to the tracking DataFrame.
-
-    Args:
-        df: Existing performance log DataFrame
-        week: Week number (1-13)
-        lift: Lift name (e.g., "Squat", "Bench Press", "Pull-ups")
-        weight: Weight used in pounds/kg
-        reps: Number of reps completed
-        total_tut: Total time under tension for the set in seconds
-        rpe: Rate of Perceived Exertion (1-10 scale)
-        tut_per_rep: Time under tension per rep in seconds (default 6s)
-        normal_tempo: Baseline tempo in seconds (default 3s)
-
-    Returns:
-        Updated DataFrame with the new record appended
+    Validate the user-supplied fields of a single set.
 
     Raises:
         ValueError: If inputs are invalid (negative values, out of range, etc.)
-
-    Example:
-        >>> df = initialize_performance_log()
-        >>> df = log_performance(df, week=1, lift="Squat", weight=225, reps=10,
-        ...                      total_tut=60, rpe=7.5)
-        >>> len(df)
-        1
     """
-    # Validate inputs
     if not 1 <= week <= 13:
         raise ValueError("week must be between 1 and 13")
+    if week % 1 != 0:
+        raise ValueError("week must be a whole number")
     if not isinstance(lift, str) or not lift.strip():
         raise ValueError("lift must be a non-empty string")
     if weight <= 0:
         raise ValueError("weight must be positive")
     if reps < 0:
         raise ValueError("reps must be non-negative")
+    if reps % 1 != 0:
+        raise ValueError("reps must be a whole number")
+    if reps > _MAX_REPS:
+        raise ValueError(f"reps must be at most {_MAX_REPS}")
     if total_tut < 0:
         raise ValueError("total_tut must be non-negative")
     if not 1 <= rpe <= 10:
         raise ValueError("rpe must be between 1 and 10")
 
-    # Determine block from week
-    block = get_block_from_week(week)
+
+def _validate_batch(fields: Dict[str, List[Any]]) -> None:
+    """
+    Validate a batch of sets column-wise with the rules of _validate_record().
+
+    Each rule is one vectorized comparison over its column; the comparisons are
+    written so NaN fails or passes exactly as in the scalar checks.
+
+    Raises:
+        ValueError: For the first invalid record, naming its first invalid field
+    """
+    weeks = np.asarray(fields['week'], dtype=np.float64)
+    weights = np.asarray(fields['weight'], dtype=np.float64)
+    reps = np.asarray(fields['reps'], dtype=np.float64)
+    tuts = np.asarray(fields['total_tut'], dtype=np.float64)
+    rpes = np.asarray(fields['rpe'], dtype=np.float64)
+    bad_lifts = np.fromiter(
+        (not isinstance(lift, str) or not lift.strip() for lift in fields['lift']),
+        dtype=bool, count=len(weeks)
+    )
+
+    # Same order as _validate_record(), so the first matching rule names the error
+    rules = (
+        (~((weeks >= 1) & (weeks <= 13)), "week must be between 1 and 13"),
+        (weeks % 1 != 0, "week must be a whole number"),
+        (bad_lifts, "lift must be a non-empty string"),
+        (weights <= 0, "weight must be positive"),
+        (reps < 0, "reps must be non-negative"),
+        (reps % 1 != 0, "reps must be a whole number"),
+        (reps > _MAX_REPS, f"reps must be at most {_MAX_REPS}"),
+        (tuts < 0, "total_tut must be non-negative"),
+        (~((rpes >= 1) & (rpes <= 10)), "rpe must be between 1 and 10"),
+    )
+    bad = np.logical_or.reduce([mask for mask, _ in rules])
+    if not bad.any():
+        return
+
+    first = int(np.argmax(bad))
+    for mask, message in rules:
+        if mask[first]:
+            raise ValueError(message)
+
+
+def _build_record(
+    week: int,
+    lift: str,
+    weight: float,
+    reps: int,
+    total_tut: float,
+    rpe: float,
+    tut_per_rep: float,
+    normal_tempo: float,
+    formula: str = "epley"
+) -> Dict[str, Any]:
+    """
+    Validate a single set and build its performance record.
+
+    Shared by log_performance() and PerformanceLogger.log() so that both paths
+    apply identical validation and derived-column calculations.
+
+    Raises:
+        ValueError: If inputs are invalid (negative values, out of range, etc.)
+    """
+    _validate_record(week, lift, weight, reps, total_tut, rpe)
+
+    # Determine block from week (already range-checked above, so index directly)
+    block = _block_of_week(week)
 
     # Calculate estimated 1RM from performance
     estimated_1rm = estimate_1rm_from_amrap(
         weight=weight,
         actual_reps=reps,
         tut_per_rep=tut_per_rep,
-        normal_tempo=normal_tempo
+        normal_tempo=normal_tempo,
+        formula=formula
     )
 
-    # Create new record
-    new_record = {
+    return {
         'week': week,
         'block': block,
         'lift': lift,
@@ -150,15 +301,315 @@ def log_performance(
         'estimated_1rm': estimated_1rm
     }
 
-    # Append to DataFrame using pd.concat for better performance
-    new_df = pd.DataFrame([new_record])
-    updated_df = pd.concat([df, new_df], ignore_index=True)
 
-    return updated_df
+class PerformanceLogger:
+    """
+    Append-only performance log that buffers records and builds a DataFrame on demand.
+
+    Appending a row to a DataFrame copies the whole frame, so logging a full
+    program set by set is quadratic. PerformanceLogger stores each column in a
+    preallocated NumPy array (structure of arrays) that doubles in capacity when
+    full, so appends are O(1) amortized, and materializes the DataFrame once,
+    when it is queried or saved. Lift names are stored as small integer codes
+    and exposed as a categorical column. The latest estimated 1RM per lift is
+    kept up to date on every append, so get_latest_1rm_by_lift() on a logger is
+    a dictionary lookup. Keep the logger object around for the whole session
+    rather than repeatedly rebinding a DataFrame.
+
+    Args:
+        capacity: Initial number of rows to preallocate (default 64)
+
+    Example:
+        >>> logger = PerformanceLogger()
+        >>> logger.log(week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7.5)
+        >>> logger.log(week=1, lift="Squat", weight=225, reps=9, total_tut=54, rpe=8)
+        >>> len(logger.to_df())
+        2
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._n = 0
+        self._capacity = capacity
+        self._columns = {
+            name: np.empty(capacity, dtype=dtype)
+            for name, dtype in _DTYPES.items()
+            if name != 'lift'
+        }
+        self._lift_codes = np.empty(capacity, dtype=np.int16)
+        self._lifts: Dict[str, int] = {}
+        self._latest: Dict[int, Tuple[int, float]] = {}
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _reserve(self, extra: int) -> None:
+        """Grow every column (by at least doubling) so `extra` more rows fit."""
+        needed = self._n + extra
+        if needed <= self._capacity:
+            return
+
+        capacity = max(needed, self._capacity * 2)
+        for name, column in self._columns.items():
+            self._columns[name] = np.resize(column, capacity)
+        self._lift_codes = np.resize(self._lift_codes, capacity)
+        self._capacity = capacity
+
+    def _lift_code(self, lift: str) -> int:
+        """Return the category code for a lift, registering new lifts in order seen."""
+        return self._lifts.setdefault(lift, len(self._lifts))
+
+    def _update_latest(self, rows: slice) -> None:
+        """Fold buffered rows into the per-lift (week, estimated 1RM) of the latest set."""
+        weeks = self._columns['week'][rows].tolist()
+        one_rms = self._columns['estimated_1rm'][rows].tolist()
+        for code, week, one_rm in zip(self._lift_codes[rows].tolist(), weeks, one_rms):
+            # Highest week wins; within a week the most recently logged set wins
+            latest = self._latest.get(code)
+            if latest is None or week >= latest[0]:
+                self._latest[code] = (week, one_rm)
+
+    def latest_1rm(self, lift: str) -> Optional[float]:
+        """Return the most recent estimated 1RM for a lift, or None if it was never logged."""
+        code = self._lifts.get(lift)
+        return None if code is None else self._latest[code][1]
+
+    def log(
+        self,
+        week: int,
+        lift: str,
+        weight: float,
+        reps: int,
+        total_tut: float,
+        rpe: float,
+        tut_per_rep: float = 6.0,
+        normal_tempo: float = 3.0,
+        formula: str = "epley"
+    ) -> None:
+        """
+        Validate and buffer a new performance record.
+
+        Takes the same arguments as log_performance() and raises the same
+        ValueError messages for invalid inputs.
+        """
+        record = _build_record(week, lift, weight, reps, total_tut, rpe,
+                               tut_per_rep, normal_tempo, formula)
+
+        self._reserve(1)
+        i = self._n
+        for name, column in self._columns.items():
+            column[i] = record[name]
+        self._lift_codes[i] = self._lift_code(lift)
+        self._n += 1
+        self._update_latest(slice(i, i + 1))
+
+    def _extend(self, frame: pd.DataFrame) -> None:
+        """Buffer already-validated records from a DataFrame with the log schema."""
+        count = len(frame)
+        self._reserve(count)
+        rows = slice(self._n, self._n + count)
+        for name, column in self._columns.items():
+            column[rows] = frame[name].to_numpy()
+        self._lift_codes[rows] = [self._lift_code(lift) for lift in frame['lift']]
+        self._n += count
+        self._update_latest(rows)
+
+    def to_df(self, copy: bool = True) -> pd.DataFrame:
+        """
+        Build a performance log DataFrame from all buffered records.
+
+        Args:
+            copy: Return a DataFrame that owns its data (default True). Read-only
+                  callers can pass False to wrap the buffered columns without
+                  copying; the result must then not be modified in place.
+
+        Returns:
+            DataFrame with the same columns as initialize_performance_log(), using
+            compact dtypes (int8/int16 integers, float32 floats, categorical lift)
+        """
+        n = self._n
+        data = {name: column[:n] for name, column in self._columns.items()}
+        data['lift'] = pd.Categorical.from_codes(self._lift_codes[:n], categories=list(self._lifts))
+        return pd.DataFrame(data, columns=_COLUMNS, copy=copy)
+
+
+def log_performance(
+    df: Union[pd.DataFrame, PerformanceLogger],
+    week: int,
+    lift: str,
+    weight: float,
+    reps: int,
+    total_tut: float,
+    rpe: float,
+    tut_per_rep: float = 6.0,
+    normal_tempo: float = 3.0,
+    formula: str = "epley",
+    inplace: bool = False
+) -> Union[pd.DataFrame, PerformanceLogger]:
+    """
+    Add a new performance record to the tracking DataFrame.
+
+    Args:
+        df: Existing performance log DataFrame, or a PerformanceLogger
+        week: Week number (1-13)
+        lift: Lift name (e.g., "Squat", "Bench Press", "Pull-ups")
+        weight: Weight used in pounds/kg
+        reps: Number of reps completed
+        total_tut: Total time under tension for the set in seconds
+        rpe: Rate of Perceived Exertion (1-10 scale)
+        tut_per_rep: Time under tension per rep in seconds (default 6s); has no
+                     effect with formula="brzycki", which rejects other values
+        normal_tempo: Baseline tempo in seconds (default 3s); likewise unused
+                      (and must stay 3s) with formula="brzycki"
+        formula: 1RM formula passed to estimate_1rm_from_amrap(): "epley"
+                 (default), "brzycki" or "fitbod"
+        inplace: Append the row to `df` itself (via df.loc[len(df)]) instead of
+                 building a new DataFrame (default False). Requires a log with the
+                 standard columns and a default RangeIndex. The log's dtypes are
+                 restored after the append.
+
+    Returns:
+        Updated DataFrame with the new record appended (the same object when
+        inplace=True). When a PerformanceLogger is passed, the record is buffered
+        in place and the same logger is returned.
+
+    Raises:
+        ValueError: If inputs are invalid (negative values, out of range, etc.),
+                   or if inplace=True and `df` does not have the log layout
+
+    Example:
+        >>> df = initialize_performance_log()
+        >>> df = log_performance(df, week=1, lift="Squat", weight=225, reps=10,
+        ...                      total_tut=60, rpe=7.5)
+        >>> len(df)
+        1
+    """
+    validate_formula(formula, tut_per_rep, normal_tempo)
+
+    # Buffered logger: append in O(1) and hand the same logger back
+    if isinstance(df, PerformanceLogger):
+        df.log(week, lift, weight, reps, total_tut, rpe, tut_per_rep, normal_tempo, formula)
+        return df
+
+    new_record = _build_record(week, lift, weight, reps, total_tut, rpe,
+                               tut_per_rep, normal_tempo, formula)
+
+    # Mutate the caller's DataFrame, reusing its storage instead of concatenating
+    if inplace:
+        if df.columns.tolist() != _COLUMNS or not df.index.equals(pd.RangeIndex(len(df))):
+            raise ValueError("inplace logging requires a performance log with default columns and index")
+        schema = df.dtypes.to_dict()
+        lift_dtype = schema['lift']
+        if isinstance(lift_dtype, pd.CategoricalDtype):
+            # Enlarge the lift column as its integer codes: a categorical column
+            # is widened to object by .loc and costly to rebuild from the names
+            lift_dtype = _merged_lift_dtype(lift_dtype, [lift])
+            new_record = {**new_record, 'lift': lift_dtype.categories.get_loc(lift)}
+            df['lift'] = df['lift'].cat.codes.to_numpy(dtype=np.int64)
+            schema['lift'] = df['lift'].dtype
+
+        # Enlargement keeps a column's dtype when the value already has it, so
+        # pass typed scalars in an object row (a numeric row would be coerced to
+        # float64). Only an empty log, which adopts the row's dtypes, needs casts.
+        was_empty = df.empty
+        df.loc[len(df)] = pd.Series([
+            dtype.type(new_record[column]) if isinstance(dtype, np.dtype) else new_record[column]
+            for column, dtype in schema.items()
+        ], index=_COLUMNS, dtype=object)
+        if was_empty:
+            df[_COLUMNS] = df.astype(schema)
+
+        if isinstance(lift_dtype, pd.CategoricalDtype):
+            df['lift'] = pd.Categorical.from_codes(df['lift'].to_numpy(), dtype=lift_dtype)
+        return df
+
+    # Append to a new DataFrame, leaving the caller's log untouched
+    return _append_rows(df, {column: [value] for column, value in new_record.items()})
+
+
+def log_performance_batch(
+    df: Union[pd.DataFrame, PerformanceLogger],
+    records: Union[List[Dict[str, Any]], pd.DataFrame],
+    tut_per_rep: float = 6.0,
+    normal_tempo: float = 3.0,
+    formula: str = "epley"
+) -> Union[pd.DataFrame, PerformanceLogger]:
+    """
+    Add many performance records to the tracking DataFrame in one step.
+
+    Each record is validated as in log_performance(), then block and estimated
+    1RM are computed for the whole batch with NumPy and the new rows are
+    appended with a single concat. Use this when backfilling historical sets.
+
+    Args:
+        df: Existing performance log DataFrame, or a PerformanceLogger
+        records: List of dicts with keys 'week', 'lift', 'weight', 'reps',
+                 'total_tut' and 'rpe', or a DataFrame with those columns
+        tut_per_rep: Time under tension per rep in seconds (default 6s); has no
+                     effect with formula="brzycki", which rejects other values
+        normal_tempo: Baseline tempo in seconds (default 3s); likewise unused
+                      (and must stay 3s) with formula="brzycki"
+        formula: 1RM formula, as in log_performance(); only the default
+                 "epley" is computed vectorized
+
+    Returns:
+        Updated DataFrame with the new records appended (or the same
+        PerformanceLogger, if one was passed)
+
+    Raises:
+        ValueError: If any record is invalid (the batch is not partially applied)
+
+    Example:
+        >>> df = initialize_performance_log()
+        >>> df = log_performance_batch(df, [
+        ...     {'week': 1, 'lift': "Squat", 'weight': 225, 'reps': 10, 'total_tut': 60, 'rpe': 7},
+        ...     {'week': 1, 'lift': "Squat", 'weight': 225, 'reps': 9, 'total_tut': 54, 'rpe': 8},
+        ... ])
+        >>> len(df)
+        2
+    """
+    validate_formula(formula, tut_per_rep, normal_tempo)
+
+    if isinstance(records, pd.DataFrame):
+        fields = {field: records[field].tolist() for field in _RECORD_FIELDS}
+    else:
+        fields = {field: [record[field] for record in records] for field in _RECORD_FIELDS}
+
+    _validate_batch(fields)
+
+    weeks = fields['week']
+    # reps are validated whole numbers; keep them as floats so the estimate sees
+    # exactly the values log_performance() would (the reps column is int16)
+    weights = np.array(fields['weight'], dtype=np.float64)
+    reps = np.array(fields['reps'], dtype=np.float64)
+
+    if formula == "epley":
+        estimated_1rms = estimate_1rm_from_amrap_vec(weights, reps, tut_per_rep, normal_tempo)
+    else:
+        estimated_1rms = [
+            estimate_1rm_from_amrap(weight, rep_count, tut_per_rep, normal_tempo, formula)
+            for weight, rep_count in zip(fields['weight'], fields['reps'])
+        ]
+
+    new_rows = {
+        'week': weeks,
+        'block': block_from_week_vec(weeks),
+        'lift': fields['lift'],
+        'weight': weights,
+        'reps': reps,
+        'total_tut': fields['total_tut'],
+        'rpe': fields['rpe'],
+        'estimated_1rm': estimated_1rms
+    }
+
+    if isinstance(df, PerformanceLogger):
+        df._extend(pd.DataFrame(new_rows, columns=_COLUMNS))
+        return df
+
+    return _append_rows(df, new_rows)
 
 
 def track_weekly_performance(
-    df: pd.DataFrame,
+    df: Union[pd.DataFrame, PerformanceLogger],
     week: int,
     lift_name: str,
     weight: float,
@@ -166,8 +617,9 @@ def track_weekly_performance(
     total_tut: float,
     rpe: float,
     tut_per_rep: float = 6.0,
-    normal_tempo: float = 3.0
-) -> pd.DataFrame:
+    normal_tempo: float = 3.0,
+    formula: str = "epley"
+) -> Union[pd.DataFrame, PerformanceLogger]:
     """
     Record weekly training data after completing workouts.
 
@@ -176,18 +628,22 @@ def track_weekly_performance(
     and appends the new record to the DataFrame.
 
     Args:
-        df: Existing performance log DataFrame
+        df: Existing performance log DataFrame, or a PerformanceLogger
         week: Current week number (1-13)
         lift_name: Which lift ("Squat", "Bench Press", "Pull-ups")
         weight: Weight used in pounds/kg
         reps: Reps completed
         total_tut: Total time under tension for the set in seconds
         rpe: RPE rating (1-10 scale)
-        tut_per_rep: Time under tension per rep in seconds (default 6s)
-        normal_tempo: Baseline tempo in seconds (default 3s)
+        tut_per_rep: Time under tension per rep in seconds (default 6s); has no
+                     effect with formula="brzycki", which rejects other values
+        normal_tempo: Baseline tempo in seconds (default 3s); likewise unused
+                      (and must stay 3s) with formula="brzycki"
+        formula: 1RM formula, as in log_performance() (default "epley")
 
     Returns:
-        Updated DataFrame with the new record appended
+        Updated DataFrame with the new record appended (or the same
+        PerformanceLogger, if one was passed)
 
     Raises:
         ValueError: If inputs are invalid (week out of range, invalid lift name,
@@ -202,7 +658,7 @@ def track_weekly_performance(
 
     Notes:
         - Block is automatically calculated from week (1-4=Block 1, 5-8=Block 2, 9-13=Block 3)
-        - Estimated 1RM is automatically calculated using TUT-adjusted Epley formula
+        - Estimated 1RM is automatically calculated with TUT-adjusted reps (Epley formula by default)
         - Use save_performance_log() separately if you want to persist to CSV
     """
     # Delegate to log_performance with parameter name mapping
@@ -215,38 +671,98 @@ def track_weekly_performance(
         total_tut=total_tut,
         rpe=rpe,
         tut_per_rep=tut_per_rep,
-        normal_tempo=normal_tempo
+        normal_tempo=normal_tempo,
+        formula=formula
     )
 
 
-def save_performance_log(df: pd.DataFrame, filepath: Union[str, Path]) -> None:
+_FEATHER_SUFFIXES = frozenset({'.feather', '.arrow'})
+_PARQUET_SUFFIXES = frozenset({'.parquet'})
+
+# Directories this process has already created/verified for saving, as
+# absolute paths so a later chdir cannot alias a relative entry
+_ensured_dirs: Set[Path] = set()
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Create directory (and parents) once per process; later saves skip the mkdir."""
+    resolved = directory.resolve()
+    if resolved in _ensured_dirs:
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(resolved)
+
+
+def _write_log(df: pd.DataFrame, filepath: Path) -> None:
+    """Write a log to filepath in the format given by its extension."""
+    suffix = filepath.suffix.lower()
+    if suffix in _FEATHER_SUFFIXES:
+        df.astype(_DTYPES).reset_index(drop=True).to_feather(filepath)
+    elif suffix in _PARQUET_SUFFIXES:
+        df.astype(_DTYPES).to_parquet(filepath, engine="pyarrow", compression="zstd", index=False)
+    else:
+        df.to_csv(filepath, index=False)
+
+
+def save_performance_log(
+    df: Union[pd.DataFrame, PerformanceLogger],
+    filepath: Union[str, Path, IO[str]]
+) -> None:
     """
-    Save performance log DataFrame to a CSV file.
+    Save performance log DataFrame to disk.
+
+    The format follows the file extension: ``.feather``/``.arrow`` write Feather,
+    ``.parquet`` writes zstd-compressed Parquet (both need pyarrow), anything
+    else writes CSV. Binary formats store the compact schema, with ``lift``
+    dictionary-encoded, so loading needs no dtype casts. A text buffer
+    (e.g. ``io.StringIO``) receives CSV.
 
     Args:
-        df: Performance log DataFrame to save
-        filepath: Path where to save the CSV file
+        df: Performance log DataFrame (or PerformanceLogger) to save
+        filepath: Path where to save the log file, or a writable text buffer
 
     Example:
         >>> df = initialize_performance_log()
         >>> df = log_performance(df, week=1, lift="Squat", weight=225, reps=10,
         ...                      total_tut=60, rpe=7.5)
         >>> save_performance_log(df, "data/training_log.csv")
+        >>> save_performance_log(df, "data/training_log.feather")
     """
+    if isinstance(df, PerformanceLogger):
+        df = df.to_df(copy=False)
+
+    if hasattr(filepath, "write"):
+        df.to_csv(filepath, index=False)
+        return
+
     filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(filepath, index=False)
+    _ensure_dir(filepath.parent)
 
+    try:
+        _write_log(df, filepath)
+    except OSError:
+        # The cached directory may have been removed since it was created;
+        # recreate it and retry once (other write errors propagate as-is)
+        if filepath.parent.is_dir():
+            raise
+        _ensured_dirs.discard(filepath.parent.resolve())
+        _ensure_dir(filepath.parent)
+        _write_log(df, filepath)
 
-def load_performance_log(filepath: Union[str, Path]) -> pd.DataFrame:
+
+def load_performance_log(filepath: Union[str, Path, IO[str]]) -> pd.DataFrame:
     """
-    Load performance log DataFrame from a CSV file.
+    Load performance log DataFrame from disk.
+
+    The format follows the file extension, mirroring save_performance_log().
+    A readable text buffer is parsed as CSV.
 
     Args:
-        filepath: Path to the CSV file to load
+        filepath: Path to the CSV, Feather or Parquet file to load, or a text buffer
 
     Returns:
-        Performance log DataFrame
+        Performance log DataFrame with compact dtypes (int8 week/block, int16 reps,
+        categorical lift, float32 weight/total_tut/rpe/estimated_1rm)
 
     Raises:
         FileNotFoundError: If the file doesn't exist
@@ -254,32 +770,39 @@ def load_performance_log(filepath: Union[str, Path]) -> pd.DataFrame:
     Example:
         >>> df = load_performance_log("data/training_log.csv")
     """
-    filepath = Path(filepath)
-    if not filepath.exists():
-        raise FileNotFoundError(f"Performance log not found at {filepath}")
-
-    df = pd.read_csv(filepath)
-
-    # Ensure proper dtypes
-    df['week'] = df['week'].astype(int)
-    df['block'] = df['block'].astype(int)
-    df['lift'] = df['lift'].astype(str)
-    df['weight'] = df['weight'].astype(float)
-    df['reps'] = df['reps'].astype(int)
-    df['total_tut'] = df['total_tut'].astype(float)
-    df['rpe'] = df['rpe'].astype(float)
-    df['estimated_1rm'] = df['estimated_1rm'].astype(float)
-
+    if not hasattr(filepath, "read"):
+        filepath = Path(filepath)
+        if not filepath.exists():
+            raise FileNotFoundError(f"Performance log not found at {filepath}")
+
+        # Feather and Parquet files already carry the compact schema
+        suffix = filepath.suffix.lower()
+        if suffix in _FEATHER_SUFFIXES:
+            return pd.read_feather(filepath)
+        if suffix in _PARQUET_SUFFIXES:
+            return pd.read_parquet(filepath)
+
+    # Type columns while parsing; use the faster pyarrow parser when installed
+    try:
+        df = pd.read_csv(filepath, engine="pyarrow", dtype=_DTYPES)
+    except ImportError:
+        df = pd.read_csv(filepath, engine="c", dtype=_DTYPES)
+
+    # Parsing infers the lift categories from the file (float64 ones for a
+    # header-only log); put them on the initialize_performance_log() footing
+    df['lift'] = df['lift'].astype(_merged_lift_dtype(_LIFT_DTYPE, df['lift'].cat.categories))
     return df
 
 
-def get_performance_by_lift(df: pd.DataFrame, lift: str) -> pd.DataFrame:
+def get_performance_by_lift(df: pd.DataFrame, lift: str, copy: bool = True) -> pd.DataFrame:
     """
     Filter performance log to show only records for a specific lift.
 
     Args:
         df: Performance log DataFrame
         lift: Lift name to filter by
+        copy: Return an independent copy (default True). Read-only callers can
+              pass False to skip the extra copy of the filtered rows.
 
     Returns:
         Filtered DataFrame containing only records for the specified lift
@@ -288,16 +811,29 @@ def get_performance_by_lift(df: pd.DataFrame, lift: str) -> pd.DataFrame:
         >>> df = load_performance_log("data/training_log.csv")
         >>> squat_data = get_performance_by_lift(df, "Squat")
     """
-    return df[df['lift'] == lift].copy()
+    lifts = df['lift']
+    if isinstance(lifts.dtype, pd.CategoricalDtype):
+        # Compare integer category codes instead of lift strings
+        categories = lifts.cat.categories
+        if lift in categories:
+            mask = lifts.cat.codes.to_numpy() == categories.get_loc(lift)
+        else:
+            mask = np.zeros(len(df), dtype=bool)
+    else:
+        mask = lifts.to_numpy() == lift
+    filtered = df[mask]
+    return filtered.copy() if copy else filtered
 
 
-def get_performance_by_week(df: pd.DataFrame, week: int) -> pd.DataFrame:
+def get_performance_by_week(df: pd.DataFrame, week: int, copy: bool = True) -> pd.DataFrame:
     """
     Filter performance log to show only records for a specific week.
 
     Args:
         df: Performance log DataFrame
         week: Week number to filter by (1-13)
+        copy: Return an independent copy (default True). Read-only callers can
+              pass False to skip the extra copy of the filtered rows.
 
     Returns:
         Filtered DataFrame containing only records for the specified week
@@ -312,16 +848,19 @@ def get_performance_by_week(df: pd.DataFrame, week: int) -> pd.DataFrame:
     if not 1 <= week <= 13:
         raise ValueError("week must be between 1 and 13")
 
-    return df[df['week'] == week].copy()
+    filtered = df[df['week'] == week]
+    return filtered.copy() if copy else filtered
 
 
-def get_performance_by_block(df: pd.DataFrame, block: int) -> pd.DataFrame:
+def get_performance_by_block(df: pd.DataFrame, block: int, copy: bool = True) -> pd.DataFrame:
     """
     Filter performance log to show only records for a specific block.
 
     Args:
         df: Performance log DataFrame
         block: Block number to filter by (1-3)
+        copy: Return an independent copy (default True). Read-only callers can
+              pass False to skip the extra copy of the filtered rows.
 
     Returns:
         Filtered DataFrame containing only records for the specified block
@@ -336,29 +875,89 @@ def get_performance_by_block(df: pd.DataFrame, block: int) -> pd.DataFrame:
     if block not in [1, 2, 3]:
         raise ValueError("block must be 1, 2, or 3")
 
-    return df[df['block'] == block].copy()
+    filtered = df[df['block'] == block]
+    return filtered.copy() if copy else filtered
 
 
-def get_latest_1rm_by_lift(df: pd.DataFrame, lift: str) -> Optional[float]:
+def get_latest_1rm_by_lift(df: Union[pd.DataFrame, PerformanceLogger], lift: str) -> Optional[float]:
     """
     Get the most recent estimated 1RM for a specific lift.
 
+    A PerformanceLogger answers from its per-lift cache without scanning the log.
+
     Args:
-        df: Performance log DataFrame
+        df: Performance log DataFrame, or a PerformanceLogger
         lift: Lift name to query
 
     Returns:
-        Most recent estimated 1RM for the lift, or None if no records exist
+        Most recent estimated 1RM for the lift (from the highest week; the last
+        logged set wins when a week has several), or None if no records exist
 
     Example:
         >>> df = load_performance_log("data/training_log.csv")
         >>> latest_squat_1rm = get_latest_1rm_by_lift(df, "Squat")
     """
-    lift_data = get_performance_by_lift(df, lift)
+    if isinstance(df, PerformanceLogger):
+        return df.latest_1rm(lift)
+
+    lift_data = get_performance_by_lift(df, lift, copy=False)
 
     if lift_data.empty:
         return None
 
-    # Get the record with the highest week number (using sort_values for compatibility)
-    latest_record = lift_data.sort_values('week', ascending=False).iloc[0]
-    return float(latest_record['estimated_1rm'])
+    # Position of the last record in the highest week, found in one O(n) pass
+    # (argmax on the reversed weeks picks the most recently logged tie)
+    weeks = lift_data['week'].to_numpy()
+    latest_pos = len(weeks) - 1 - int(np.argmax(weeks[::-1]))
+    return float(lift_data['estimated_1rm'].iat[latest_pos])
+
+
+def build_performance_index(df: pd.DataFrame, by: str = 'lift') -> Dict[Any, pd.DataFrame]:
+    """
+    Partition a performance log by lift, week or block in a single pass.
+
+    Use this instead of calling the get_performance_by_*() filters repeatedly
+    (e.g., when building per-lift or per-week charts): the log is grouped once
+    and each lookup is a dictionary get rather than a boolean scan of the log.
+
+    Args:
+        df: Performance log DataFrame
+        by: Column to partition on: 'lift' (default), 'week' or 'block'
+
+    Returns:
+        Dictionary mapping each value present in the column to its records, in
+        order of first appearance
+
+    Raises:
+        ValueError: If by is not 'lift', 'week' or 'block'
+
+    Example:
+        >>> df = load_performance_log("data/training_log.csv")
+        >>> by_week = build_performance_index(df, by='week')
+        >>> week1_data = by_week[1]
+    """
+    if by not in _INDEX_COLUMNS:
+        raise ValueError("by must be one of: lift, week, block")
+
+    return {key: records for key, records in df.groupby(by, sort=False, observed=True)}
+
+
+def build_lift_index(df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Partition a performance log by lift in a single pass.
+
+    Use this instead of calling get_performance_by_lift() repeatedly (e.g., when
+    building per-lift charts): the log is scanned once rather than once per lift.
+
+    Args:
+        df: Performance log DataFrame
+
+    Returns:
+        Dictionary mapping each lift name present in the log to its records
+
+    Example:
+        >>> df = load_performance_log("data/training_log.csv")
+        >>> by_lift = build_lift_index(df)
+        >>> squat_data = by_lift["Squat"]
+    """
+    return build_performance_index(df, by='lift')
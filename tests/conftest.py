@@ -0,0 +1,61 @@
+"""
+Shared pytest fixtures.
+
+The canonical training plans are built once at import, so each pytest (or
+pytest-xdist worker) process constructs them a single time for every test
+file that uses them.
+"""
+
+import types
+
+import pytest
+from src.training.planner import build_training_plan
+
+# Week-2 AMRAP of 225 × 10 at the default 6s/3s tempo
+AMRAP_WEEK2 = {2: {'weight': 225.0, 'actual_reps': 10}}
+
+# Full-program scenario: an AMRAP result for every AMRAP week
+INTEGRATION_AMRAP = {
+    2: {'weight': 225.0, 'actual_reps': 10},  # Block 1
+    3: {'weight': 281.25, 'actual_reps': 8},
+    4: {'weight': 300.0, 'actual_reps': 7},
+    6: {'weight': 310.0, 'actual_reps': 9},   # Block 2
+    7: {'weight': 330.0, 'actual_reps': 7},
+    8: {'weight': 340.0, 'actual_reps': 6},
+    10: {'weight': 350.0, 'actual_reps': 8},  # Block 3
+    11: {'weight': 360.0, 'actual_reps': 7},
+    12: {'weight': 370.0, 'actual_reps': 5},
+}
+
+# Read-only so that sharing them across tests is safe
+PLAN_300 = types.MappingProxyType(build_training_plan(start_1rm=300.0))
+PLAN_300_WITH_WEEK2_AMRAP = types.MappingProxyType(
+    build_training_plan(start_1rm=300.0, amrap_results=AMRAP_WEEK2)
+)
+PLAN_INTEGRATION = types.MappingProxyType(
+    build_training_plan(start_1rm=300.0, amrap_results=INTEGRATION_AMRAP)
+)
+
+
+@pytest.fixture(scope="session")
+def plan_300():
+    """Default 300 lb training plan."""
+    return PLAN_300
+
+
+@pytest.fixture(scope="session")
+def plan_300_w2_amrap():
+    """300 lb plan updated by a week-2 AMRAP of 225 × 10 at the default tempo."""
+    return PLAN_300_WITH_WEEK2_AMRAP
+
+
+@pytest.fixture(scope="session")
+def integration_amrap():
+    """AMRAP results for every AMRAP week of the full-program scenario."""
+    return types.MappingProxyType(INTEGRATION_AMRAP)
+
+
+@pytest.fixture(scope="session")
+def plan_integration():
+    """300 lb plan updated by every result in integration_amrap."""
+    return PLAN_INTEGRATION
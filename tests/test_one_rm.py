@@ -1,40 +1,42 @@
 """
 Unit tests for 1RM estimation and effective reps calculation
 """
+import re
+
+import numpy as np
 import pytest
-from src.training.one_rm import calculate_effective_reps, estimate_1rm_from_amrap
+from src.training.one_rm import (
+    calculate_effective_reps,
+    estimate_1rm_from_amrap,
+    estimate_1rm_from_amrap_batch_jit,
+    estimate_1rm_from_amrap_vec,
+    estimate_1rm_brzycki,
+    estimate_1rm_fitbod
+)
+
+# Error-message patterns shared by the validation tests
+POS_WEIGHT = re.compile(r"weight must be positive")
+NEG_REPS = re.compile(r"actual_reps must be non-negative")
+POS_TUT = re.compile(r"tut_per_rep must be positive")
+POS_TEMPO = re.compile(r"normal_tempo must be positive")
 
 
 class TestCalculateEffectiveReps:
     """Test suite for calculate_effective_reps function"""
 
-    def test_basic_calculation(self):
-        """Test basic TUT adjustment calculation"""
+    @pytest.mark.parametrize("reps, tut, normal, expected", [
         # 10 reps at 6s TUT with 3s normal = 20 effective reps
-        result = calculate_effective_reps(10, tut_per_rep=6.0, normal_tempo=3.0)
-        assert result == 20.0
-
-    def test_normal_tempo_no_adjustment(self):
-        """Test that normal tempo results in no adjustment"""
-        # 10 reps at 3s TUT with 3s normal = 10 effective reps
-        result = calculate_effective_reps(10, tut_per_rep=3.0, normal_tempo=3.0)
-        assert result == 10.0
-
-    def test_slower_tempo_increases_effective_reps(self):
-        """Test that slower tempo increases effective reps"""
+        pytest.param(10, 6.0, 3.0, 20.0, id="basic"),
+        # Normal tempo results in no adjustment
+        pytest.param(10, 3.0, 3.0, 10.0, id="normal-tempo"),
         # 5 reps at 9s TUT with 3s normal = 15 effective reps
-        result = calculate_effective_reps(5, tut_per_rep=9.0, normal_tempo=3.0)
-        assert result == 15.0
-
-    def test_zero_reps(self):
-        """Test edge case: 0 reps"""
-        result = calculate_effective_reps(0, tut_per_rep=6.0, normal_tempo=3.0)
-        assert result == 0.0
-
-    def test_high_rep_count(self):
-        """Test edge case: extremely high reps"""
-        result = calculate_effective_reps(50, tut_per_rep=6.0, normal_tempo=3.0)
-        assert result == 100.0
+        pytest.param(5, 9.0, 3.0, 15.0, id="slower-tempo"),
+        pytest.param(0, 6.0, 3.0, 0.0, id="zero-reps"),
+        pytest.param(50, 6.0, 3.0, 100.0, id="high-reps"),
+    ])
+    def test_effective_reps(self, reps, tut, normal, expected):
+        """Test TUT adjustment of reps across tempos and rep counts"""
+        assert calculate_effective_reps(reps, tut_per_rep=tut, normal_tempo=normal) == expected
 
     def test_default_parameters(self):
         """Test that default parameters work correctly"""
@@ -42,98 +44,228 @@ class TestCalculateEffectiveReps:
         result = calculate_effective_reps(8)
         assert result == 16.0
 
-    def test_negative_reps_raises_error(self):
-        """Test that negative reps raises ValueError"""
-        with pytest.raises(ValueError, match="actual_reps must be non-negative"):
-            calculate_effective_reps(-5)
-
-    def test_zero_tut_raises_error(self):
-        """Test that zero or negative TUT raises ValueError"""
-        with pytest.raises(ValueError, match="tut_per_rep must be positive"):
-            calculate_effective_reps(10, tut_per_rep=0)
-
-    def test_negative_normal_tempo_raises_error(self):
-        """Test that negative normal_tempo raises ValueError"""
-        with pytest.raises(ValueError, match="normal_tempo must be positive"):
-            calculate_effective_reps(10, normal_tempo=-3)
+    @pytest.mark.parametrize("kwargs, pattern", [
+        pytest.param(dict(actual_reps=-5), NEG_REPS, id="negative-reps"),
+        pytest.param(dict(actual_reps=10, tut_per_rep=0), POS_TUT, id="zero-tut"),
+        pytest.param(dict(actual_reps=10, normal_tempo=-3), POS_TEMPO, id="negative-normal-tempo"),
+    ])
+    def test_invalid_inputs_raise_error(self, kwargs, pattern):
+        """Test that invalid reps or tempos raise ValueError"""
+        with pytest.raises(ValueError, match=pattern):
+            calculate_effective_reps(**kwargs)
 
 
 class TestEstimate1RMFromAMRAP:
     """Test suite for estimate_1rm_from_amrap function"""
 
-    def test_basic_estimation(self):
-        """Test basic 1RM estimation with known values"""
-        # 225 lbs × 10 reps at 6s TUT = 20 effective reps
-        # Epley: 225 × (1 + 20/30) = 225 × 1.6667 = 375
-        result = estimate_1rm_from_amrap(225, 10, tut_per_rep=6.0, normal_tempo=3.0)
-        assert result == pytest.approx(375.0, rel=0.01)
-
-    def test_normal_tempo_estimation(self):
-        """Test 1RM estimation without TUT adjustment"""
-        # 100 lbs × 10 reps at normal tempo
-        # Epley: 100 × (1 + 10/30) = 100 × 1.333 = 133.33
-        result = estimate_1rm_from_amrap(100, 10, tut_per_rep=3.0, normal_tempo=3.0)
-        assert result == pytest.approx(133.33, rel=0.01)
-
-    def test_low_rep_high_weight(self):
-        """Test estimation with low reps (closer to 1RM)"""
-        # 300 lbs × 3 reps at 6s TUT = 6 effective reps
-        # Epley: 300 × (1 + 6/30) = 300 × 1.2 = 360
-        result = estimate_1rm_from_amrap(300, 3, tut_per_rep=6.0, normal_tempo=3.0)
-        assert result == pytest.approx(360.0, rel=0.01)
-
-    def test_high_rep_lower_weight(self):
-        """Test estimation with high reps"""
-        # 135 lbs × 20 reps at 6s TUT = 40 effective reps
-        # Epley: 135 × (1 + 40/30) = 135 × 2.333 = 315
-        result = estimate_1rm_from_amrap(135, 20, tut_per_rep=6.0, normal_tempo=3.0)
-        assert result == pytest.approx(315.0, rel=0.01)
+    @pytest.mark.parametrize("weight, reps, tut, normal, expected", [
+        # Closer to 1RM: 300 × (1 + 6/30) = 360
+        pytest.param(300, 3, 6.0, 3.0, 360.0, id="low-rep-high-weight"),
+        # 300 × (1 + 2/30) = 320
+        pytest.param(300, 1, 6.0, 3.0, 320.0, id="single-rep"),
+        # Weighted pull-ups, 45 lbs added: 45 × (1 + 24/30) = 81
+        pytest.param(45, 12, 6.0, 3.0, 81.0, id="bodyweight-pullups"),
+    ])
+    def test_estimate_1rm_exact(self, weight, reps, tut, normal, expected):
+        """Test Epley estimates whose floating-point result is exact"""
+        assert estimate_1rm_from_amrap(weight, reps, tut_per_rep=tut, normal_tempo=normal) == expected
+
+    @pytest.mark.parametrize("weight, reps, tut, normal, expected", [
+        # 225 × (1 + 20/30) = 375 (rounds to 374.99999999999994)
+        pytest.param(225, 10, 6.0, 3.0, 225 * (1 + 20 / 30), id="basic"),
+        # No TUT adjustment: 100 × (1 + 10/30) = 133.33
+        pytest.param(100, 10, 3.0, 3.0, 100 * (1 + 10 / 30), id="normal-tempo"),
+        # 135 × (1 + 40/30) = 315
+        pytest.param(135, 20, 6.0, 3.0, 135 * (1 + 40 / 30), id="high-rep-lower-weight"),
+        # 50+ reps: 100 × (1 + 100/30) = 433.33
+        pytest.param(100, 50, 6.0, 3.0, 100 * (1 + 100 / 30), id="extremely-high-reps"),
+    ])
+    def test_estimate_1rm(self, weight, reps, tut, normal, expected):
+        """Test Epley estimates on TUT-adjusted effective reps"""
+        result = estimate_1rm_from_amrap(weight, reps, tut_per_rep=tut, normal_tempo=normal)
+        assert result == pytest.approx(expected, abs=1e-9)
 
     def test_zero_reps_returns_weight(self):
         """Test edge case: 0 reps returns the weight itself"""
         result = estimate_1rm_from_amrap(315, 0)
         assert result == 315.0
 
-    def test_single_rep(self):
-        """Test with single rep"""
-        # 300 lbs × 1 rep at 6s TUT = 2 effective reps
-        # Epley: 300 × (1 + 2/30) = 300 × 1.0667 = 320
-        result = estimate_1rm_from_amrap(300, 1, tut_per_rep=6.0, normal_tempo=3.0)
-        assert result == pytest.approx(320.0, rel=0.01)
-
     def test_default_parameters(self):
         """Test that default parameters work correctly"""
         # Default is 6s TUT, 3s normal
         result = estimate_1rm_from_amrap(200, 8)
         # 8 reps × 2 = 16 effective reps
         # 200 × (1 + 16/30) = 200 × 1.533 = 306.67
-        assert result == pytest.approx(306.67, rel=0.01)
+        assert result == pytest.approx(200 * (1 + 16 / 30), abs=1e-9)
+
+    @pytest.mark.parametrize("kwargs, pattern", [
+        pytest.param(dict(weight=-225, actual_reps=10), POS_WEIGHT, id="negative-weight"),
+        pytest.param(dict(weight=0, actual_reps=10), POS_WEIGHT, id="zero-weight"),
+        pytest.param(dict(weight=225, actual_reps=-5), NEG_REPS, id="negative-reps"),
+    ])
+    def test_invalid_inputs_raise_error(self, kwargs, pattern):
+        """Test that invalid weight or reps raise ValueError"""
+        with pytest.raises(ValueError, match=pattern):
+            estimate_1rm_from_amrap(**kwargs)
+
+    def test_fitbod_formula_uses_effective_reps(self):
+        """Test that formula='fitbod' applies Fitbod to TUT-adjusted reps"""
+        result = estimate_1rm_from_amrap(225, 5, formula="fitbod")
+        assert result == pytest.approx(estimate_1rm_fitbod(225, 10))
+
+    def test_brzycki_formula_uses_actual_reps(self):
+        """Test that formula='brzycki' applies Brzycki to the reps completed, not TUT-adjusted reps"""
+        assert estimate_1rm_from_amrap(275, 12, formula="brzycki") == 396.0
+
+    @pytest.mark.parametrize("tempo", [
+        pytest.param(dict(tut_per_rep=3.0), id="tut_per_rep"),
+        pytest.param(dict(normal_tempo=2.0), id="normal_tempo"),
+    ])
+    def test_brzycki_formula_rejects_tempo_arguments(self, tempo):
+        """Test that tempos Brzycki would ignore are rejected, even for 0 reps"""
+        for reps in (12, 0):
+            with pytest.raises(ValueError, match="no effect with the brzycki formula"):
+                estimate_1rm_from_amrap(275, reps, formula="brzycki", **tempo)
+
+    def test_brzycki_formula_limit_in_actual_reps(self):
+        """Test that the 37-rep Brzycki limit applies to the reps completed"""
+        assert estimate_1rm_from_amrap(100, 19, formula="brzycki") == pytest.approx(200.0)
+        with pytest.raises(ValueError, match="below 37"):
+            estimate_1rm_from_amrap(100, 37, formula="brzycki")
+
+    def test_unknown_formula_raises_error(self):
+        """Test that an unknown formula name raises ValueError"""
+        with pytest.raises(ValueError, match="formula must be one of"):
+            estimate_1rm_from_amrap(225, 10, formula="lombardi")
+
+    def test_unknown_formula_raises_error_for_zero_reps(self):
+        """Test that the formula is checked before the 0-rep short-circuit"""
+        with pytest.raises(ValueError, match="formula must be one of"):
+            estimate_1rm_from_amrap(225, 0, formula="lombardi")
+
+
+class TestEstimate1RMFitbod:
+    """Test suite for estimate_1rm_fitbod function"""
+
+    def test_basic_estimation(self):
+        """Test against the closed-form Fitbod equation"""
+        # 225 × (1 + 9^0.85 / (-2.55 + 4.58 × ln 225)) ≈ 290.44
+        assert estimate_1rm_fitbod(225, 10) == pytest.approx(290.44, rel=0.001)
 
-    def test_negative_weight_raises_error(self):
-        """Test that negative weight raises ValueError"""
-        with pytest.raises(ValueError, match="weight must be positive"):
-            estimate_1rm_from_amrap(-225, 10)
+    def test_single_rep_returns_weight(self):
+        """Test that one rep (or fewer) returns the weight itself"""
+        assert estimate_1rm_fitbod(315, 1) == 315
+        assert estimate_1rm_fitbod(315, 0) == 315
 
-    def test_zero_weight_raises_error(self):
+    def test_log_term_uses_half_pound_rounding(self):
+        """Test that nearby weights share the cached log term"""
+        base = estimate_1rm_fitbod(225.0, 8) / 225.0
+        assert estimate_1rm_fitbod(225.2, 8) / 225.2 == pytest.approx(base)
+
+    def test_non_positive_weight_raises_error(self):
+        """Test that zero weight raises ValueError"""
+        with pytest.raises(ValueError, match=POS_WEIGHT):
+            estimate_1rm_fitbod(0, 10)
+
+    @pytest.mark.parametrize("weight", [
+        pytest.param(1.5, id="non-positive-log"),
+        pytest.param(0.2, id="rounds-to-zero"),
+    ])
+    def test_too_light_weight_raises_error(self, weight):
+        """Test that weights with a non-positive (or undefined) log term raise ValueError"""
+        with pytest.raises(ValueError, match="too light"):
+            estimate_1rm_fitbod(weight, 10)
+
+
+class TestEstimate1RMBrzycki:
+    """Test suite for estimate_1rm_brzycki function"""
+
+    @pytest.mark.parametrize("weight, reps, expected", [
+        pytest.param(275, 12, 396.0, id="275x12"),
+        pytest.param(315, 1, 315.0, id="single-rep"),
+        pytest.param(100, 0, 100 * 36 / 37, id="zero-reps"),
+    ])
+    def test_estimation(self, weight, reps, expected):
+        """Test against the closed-form Brzycki equation"""
+        assert estimate_1rm_brzycki(weight, reps) == pytest.approx(expected, abs=1e-9)
+
+    def test_non_positive_weight_raises_error(self):
         """Test that zero weight raises ValueError"""
-        with pytest.raises(ValueError, match="weight must be positive"):
-            estimate_1rm_from_amrap(0, 10)
+        with pytest.raises(ValueError, match=POS_WEIGHT):
+            estimate_1rm_brzycki(0, 10)
+
+    def test_reps_at_asymptote_raise_error(self):
+        """Test that 37 or more reps, where the formula is undefined, raise ValueError"""
+        with pytest.raises(ValueError, match="below 37"):
+            estimate_1rm_brzycki(225, 37)
+
+
+class TestEstimate1RMFromAMRAPVec:
+    """Test suite for estimate_1rm_from_amrap_vec function"""
+
+    def test_matches_scalar_version(self):
+        """Vectorized results should match the scalar function exactly"""
+        weights = [225, 100, 300, 135, 315, 45]
+        reps = [10, 10, 3, 20, 0, 12]
+        expected = [estimate_1rm_from_amrap(w, r) for w, r in zip(weights, reps)]
+
+        result = estimate_1rm_from_amrap_vec(weights, reps)
+        assert result.tolist() == expected
+
+    def test_custom_tempo(self):
+        """Custom TUT parameters should apply to every element"""
+        result = estimate_1rm_from_amrap_vec([100, 100], [10, 0], tut_per_rep=3.0, normal_tempo=3.0)
+        np.testing.assert_allclose(result, [100 * (1 + 10 / 30), 100.0])
+
+    def test_scalar_inputs(self):
+        """Scalar inputs should broadcast to a 0-d array"""
+        result = estimate_1rm_from_amrap_vec(225, 10)
+        assert float(result) == pytest.approx(375.0)
+
+    def test_non_positive_weight_raises_error(self):
+        """Any non-positive weight should raise ValueError"""
+        with pytest.raises(ValueError, match=POS_WEIGHT):
+            estimate_1rm_from_amrap_vec([225, 0], [10, 10])
 
     def test_negative_reps_raises_error(self):
-        """Test that negative reps raises ValueError"""
-        with pytest.raises(ValueError, match="actual_reps must be non-negative"):
-            estimate_1rm_from_amrap(225, -5)
-
-    def test_extremely_high_reps(self):
-        """Test edge case: very high rep count (50+ reps)"""
-        # 100 lbs × 50 reps at 6s TUT = 100 effective reps
-        # Epley: 100 × (1 + 100/30) = 100 × 4.333 = 433.33
-        result = estimate_1rm_from_amrap(100, 50, tut_per_rep=6.0, normal_tempo=3.0)
-        assert result == pytest.approx(433.33, rel=0.01)
-
-    def test_bodyweight_pullups_scenario(self):
-        """Test realistic scenario: bodyweight pull-ups with added weight"""
-        # 45 lbs added × 12 reps at 6s TUT = 24 effective reps
-        # Epley: 45 × (1 + 24/30) = 45 × 1.8 = 81
-        result = estimate_1rm_from_amrap(45, 12, tut_per_rep=6.0, normal_tempo=3.0)
-        assert result == pytest.approx(81.0, rel=0.01)
+        """Any negative rep count should raise ValueError"""
+        with pytest.raises(ValueError, match=NEG_REPS):
+            estimate_1rm_from_amrap_vec([225, 225], [10, -1])
+
+    def test_invalid_tempo_raises_error(self):
+        """Non-positive tempo parameters should raise ValueError"""
+        with pytest.raises(ValueError, match=POS_TUT):
+            estimate_1rm_from_amrap_vec([225], [10], tut_per_rep=0)
+        with pytest.raises(ValueError, match=POS_TEMPO):
+            estimate_1rm_from_amrap_vec([225], [10], normal_tempo=-3)
+
+    def test_zero_reps_skip_tempo_validation(self):
+        """All-0-rep batches should ignore the tempos, like estimate_1rm_from_amrap()"""
+        assert estimate_1rm_from_amrap(225, 0, tut_per_rep=0) == 225
+        np.testing.assert_array_equal(estimate_1rm_from_amrap_vec([225, 315], [0, 0], tut_per_rep=0), [225, 315])
+        np.testing.assert_array_equal(estimate_1rm_from_amrap_vec([225, 315], [0, 0], normal_tempo=0), [225, 315])
+        np.testing.assert_array_equal(estimate_1rm_from_amrap_batch_jit([225], [0], normal_tempo=0), [225])
+
+
+class TestEstimate1RMFromAMRAPBatchJit:
+    """Test suite for estimate_1rm_from_amrap_batch_jit (runs with or without numba)"""
+
+    def test_matches_vectorized_version(self):
+        """JIT batch results should match the NumPy implementation"""
+        weights = [225, 100, 300, 135, 315, 45]
+        reps = [10, 10, 3, 20, 0, 12]
+
+        result = estimate_1rm_from_amrap_batch_jit(weights, reps)
+        np.testing.assert_allclose(result, estimate_1rm_from_amrap_vec(weights, reps), rtol=1e-12)
+
+    def test_empty_batch(self):
+        """An empty batch should return an empty array"""
+        result = estimate_1rm_from_amrap_batch_jit([], [])
+        assert result.shape == (0,)
+
+    def test_invalid_inputs_raise_error(self):
+        """Batch inputs should be validated like the scalar function"""
+        with pytest.raises(ValueError, match=POS_WEIGHT):
+            estimate_1rm_from_amrap_batch_jit([0, 225], [10, 10])
+        with pytest.raises(ValueError, match=NEG_REPS):
+            estimate_1rm_from_amrap_batch_jit([225], [-1])
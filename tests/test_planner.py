@@ -2,122 +2,210 @@
 Tests for training plan generation functions.
 """
 
+import dataclasses
+import functools
+import re
+from math import isclose
+import types
+
+import numpy as np
 import pytest
-from src.training.planner import build_training_plan, suggest_next_week_workout
+from src.training.planner import (
+    WeekPlan,
+    build_training_plan,
+    suggest_next_week_workout,
+    suggest_next_week_workouts_all
+)
+
+# Error-message patterns shared by the build_training_plan validation tests
+POS_START_1RM = re.compile(r"start_1rm must be positive")
+BLOCKS_TYPE = re.compile(r"must be a list or tuple of blocks")
+THREE_BLOCKS = re.compile(r"must contain exactly 3 blocks")
+BLOCK_WEEKS = re.compile(r"must have 4, 4, and 5 weeks")
+AMRAP_KEYS = re.compile(r"must contain 'weight' and 'actual_reps'")
+
+# Error-message patterns shared by the workout suggestion validation tests
+WEEK_RANGE = re.compile(r"current_week must be between 1 and 13")
+WEEK_MISSING = re.compile(r"Week 2 not found in training_plan")
+LIFT_NAME = re.compile(r"lift_name must be one of: Squat, Bench Press, Pull-ups")
+
+
+def _expected_1rm(weight, reps, tut=6.0, norm=3.0):
+    """
+    Epley 1RM on TUT-adjusted reps; the single source of expected values below.
+
+    Uses the same operations, in the same order, as estimate_1rm_from_amrap(), so
+    plan values can be compared with == rather than pytest.approx.
+    """
+    effective_reps = reps * (tut / norm)
+    return weight if reps == 0 else weight * (1 + effective_reps / 30)
+
+
+# Tolerance (lbs) for prescribed weights recomputed from plan fields
+WEIGHT_TOL = 0.01
+
+# Fields every plan week / workout prescription must carry
+REQUIRED_WEEK_KEYS = frozenset({'prescribed_weight', 'current_1rm', 'percentage', 'sets', 'is_amrap_week'})
+REQUIRED_WORKOUT_KEYS = frozenset({
+    'week', 'lift', 'sets', 'target_reps', 'weight', 'is_amrap_week', 'instructions'
+})
+
+# Default intensity per week: Block 1 (weeks 1-4), Block 2 (5-8), Block 3 (9-13, week 13 deload)
+EXPECTED_DEFAULT_PCTS = {
+    1: 0.7, 2: 0.75, 3: 0.8, 4: 0.725,
+    5: 0.775, 6: 0.825, 7: 0.85, 8: 0.775,
+    9: 0.8, 10: 0.85, 11: 0.875, 12: 0.9, 13: 0.65,
+}
+
+# Sets per week: 3 (Block 1) → 4 (Block 2) → 5 (Block 3)
+EXPECTED_SETS = {**dict.fromkeys(range(1, 5), 3), **dict.fromkeys(range(5, 9), 4), **dict.fromkeys(range(9, 14), 5)}
+
+
+def _freeze_amrap(amrap_results):
+    """Hashable form of an amrap_results dict, for use as a cache key."""
+    if not amrap_results:
+        return None
+    return tuple(sorted((week, tuple(sorted(data.items()))) for week, data in amrap_results.items()))
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_plan_for_key(start_1rm, amrap_key):
+    amrap_results = {week: dict(items) for week, items in amrap_key} if amrap_key else None
+    return types.MappingProxyType(build_training_plan(start_1rm=start_1rm, amrap_results=amrap_results))
+
+
+def _cached_plan(start_1rm, amrap_results=None):
+    """build_training_plan() memoized on its inputs; returns a read-only plan."""
+    return _cached_plan_for_key(start_1rm, _freeze_amrap(amrap_results))
+
+
+# 1RM in effect from week 3 after a week-2 AMRAP of 225 × 10 (20 effective reps): 375
+EXPECTED_W3 = _expected_1rm(225.0, 10)
+# 1RM in effect from week 4 after a week-3 AMRAP of 300 × 8 (16 effective reps): 460
+EXPECTED_W4 = _expected_1rm(300.0, 8)
+
+
+# id(plan) -> (plan, summary); holding the plan keeps its id from being reused
+_PLAN_SHAPES = {}
+
+
+def _validate_plan_shape(plan):
+    """
+    Check a plan's week numbering, keys and prescribed weights in a single pass.
+
+    Results are cached per plan object, so tests sharing a fixture plan only pay
+    for one pass between them.
+    """
+    cached = _PLAN_SHAPES.get(id(plan))
+    if cached is not None and cached[0] is plan:
+        return cached[1]
+
+    weeks = sorted(plan)
+    keys_ok = True
+    prescribed_ok = True
+    for week in weeks:
+        week_plan = plan[week]
+        keys_ok = keys_ok and REQUIRED_WEEK_KEYS <= week_plan.keys()
+        prescribed_ok = prescribed_ok and abs(
+            week_plan['prescribed_weight'] - week_plan['current_1rm'] * week_plan['percentage']
+        ) < WEIGHT_TOL
+
+    summary = types.SimpleNamespace(weeks=weeks, keys_ok=keys_ok, prescribed_ok=prescribed_ok)
+    _PLAN_SHAPES[id(plan)] = (plan, summary)
+    return summary
+
+
+def _expected_1rm_chain(start_1rm, amrap_results):
+    """1RM in effect for weeks 1-13; each AMRAP result applies from the following week."""
+    in_effect = []
+    current = start_1rm
+    for week in range(1, 14):
+        in_effect.append(current)
+        if week in amrap_results:
+            current = _expected_1rm(amrap_results[week]['weight'], amrap_results[week]['actual_reps'])
+    return np.array(in_effect)
+
+
+# Expected per-week oracle arrays (index 0 = week 1)
+EXPECTED_PCTS_ARRAY = np.array(list(EXPECTED_DEFAULT_PCTS.values()))
+EXPECTED_SETS_ARRAY = np.array(list(EXPECTED_SETS.values()))
+EXPECTED_AMRAP_ARRAY = np.isin(np.arange(1, 14), [2, 3, 4, 6, 7, 8, 10, 11, 12])
+
+
+@pytest.fixture(scope="module")
+def integration_expected_1rm(integration_amrap):
+    """Oracle 1RM chain for the full-program scenario, computed once per module."""
+    return _expected_1rm_chain(300.0, integration_amrap)
 
 
 class TestBuildTrainingPlan:
     """Test suite for build_training_plan() function."""
 
-    def test_generates_13_weeks(self):
+    def test_generates_13_weeks(self, plan_300):
         """Plan should generate exactly 13 weeks."""
-        plan = build_training_plan(start_1rm=300.0)
-        assert len(plan) == 13
-        assert all(week in plan for week in range(1, 14))
+        shape = _validate_plan_shape(plan_300)
+        assert shape.weeks == list(range(1, 14))
+        assert shape.keys_ok
 
-    def test_week1_uses_start_1rm(self):
+    def test_week1_uses_start_1rm(self, plan_300):
         """Week 1 should use the initial 1RM with 70% intensity."""
         start_1rm = 300.0
-        plan = build_training_plan(start_1rm=start_1rm)
-
-        week1 = plan[1]
+        week1 = plan_300[1]
         assert week1['current_1rm'] == start_1rm
         assert week1['percentage'] == 0.7
         assert week1['prescribed_weight'] == start_1rm * 0.7  # 210.0
 
-    def test_default_block_percentages(self):
+    @pytest.mark.parametrize("week, pct", list(EXPECTED_DEFAULT_PCTS.items()))
+    def test_default_block_percentages(self, plan_300, week, pct):
         """Should use correct default percentages for each block."""
-        plan = build_training_plan(start_1rm=300.0)
+        assert plan_300[week]['percentage'] == pct
 
-        # Block 1 (Weeks 1-4): [0.7, 0.75, 0.8, 0.725]
-        assert plan[1]['percentage'] == 0.7
-        assert plan[2]['percentage'] == 0.75
-        assert plan[3]['percentage'] == 0.8
-        assert plan[4]['percentage'] == 0.725
-
-        # Block 2 (Weeks 5-8): [0.775, 0.825, 0.85, 0.775]
-        assert plan[5]['percentage'] == 0.775
-        assert plan[6]['percentage'] == 0.825
-        assert plan[7]['percentage'] == 0.85
-        assert plan[8]['percentage'] == 0.775
-
-        # Block 3 (Weeks 9-13): [0.8, 0.85, 0.875, 0.9, 0.65]
-        assert plan[9]['percentage'] == 0.8
-        assert plan[10]['percentage'] == 0.85
-        assert plan[11]['percentage'] == 0.875
-        assert plan[12]['percentage'] == 0.9
-        assert plan[13]['percentage'] == 0.65  # Deload week
-
-    def test_progressive_volume_sets(self):
+    @pytest.mark.parametrize("week, expected_sets", list(EXPECTED_SETS.items()))
+    def test_progressive_volume_sets(self, plan_300, week, expected_sets):
         """Sets should progress: 3 (Block 1) → 4 (Block 2) → 5 (Block 3)."""
-        plan = build_training_plan(start_1rm=300.0)
-
-        # Block 1: 3 sets
-        for week in range(1, 5):
-            assert plan[week]['sets'] == 3, f"Week {week} should have 3 sets"
-
-        # Block 2: 4 sets
-        for week in range(5, 9):
-            assert plan[week]['sets'] == 4, f"Week {week} should have 4 sets"
-
-        # Block 3: 5 sets
-        for week in range(9, 14):
-            assert plan[week]['sets'] == 5, f"Week {week} should have 5 sets"
+        assert plan_300[week]['sets'] == expected_sets
 
-    def test_amrap_week_identification(self):
+    def test_amrap_week_identification(self, plan_300):
         """AMRAP weeks should be 2-4, 6-8, 10-12."""
-        plan = build_training_plan(start_1rm=300.0)
-
-        amrap_weeks = {2, 3, 4, 6, 7, 8, 10, 11, 12}
-        non_amrap_weeks = {1, 5, 9, 13}
-
-        for week in amrap_weeks:
-            assert plan[week]['is_amrap_week'] is True, f"Week {week} should be AMRAP week"
-
-        for week in non_amrap_weeks:
-            assert plan[week]['is_amrap_week'] is False, f"Week {week} should not be AMRAP week"
+        actual_amrap = {week for week, week_plan in plan_300.items() if week_plan['is_amrap_week']}
+        assert actual_amrap == {2, 3, 4, 6, 7, 8, 10, 11, 12}
 
-    def test_1rm_update_from_amrap(self):
+    def test_1rm_update_from_amrap(self, plan_300_w2_amrap):
         """1RM should update based on AMRAP results for subsequent weeks."""
-        start_1rm = 300.0
-
-        # Week 2 AMRAP: 10 reps at 225 lbs with 6s TUT
-        # Effective reps = 10 * (6/3) = 20
-        # New 1RM = 225 * (1 + 20/30) = 225 * 1.667 = 375
-        amrap_results = {
-            2: {'weight': 225.0, 'actual_reps': 10, 'tut_per_rep': 6.0, 'normal_tempo': 3.0}
-        }
-
-        plan = build_training_plan(start_1rm=start_1rm, amrap_results=amrap_results)
+        plan = plan_300_w2_amrap
 
         # Week 2 should still use original 1RM
-        assert plan[2]['current_1rm'] == start_1rm
+        assert plan[2]['current_1rm'] == 300.0
 
-        # Week 3 and beyond should use updated 1RM (375)
-        expected_new_1rm = 375.0
-        assert plan[3]['current_1rm'] == pytest.approx(expected_new_1rm)
-        assert plan[4]['current_1rm'] == pytest.approx(expected_new_1rm)
+        # Week 3 and beyond should use updated 1RM
+        assert plan[3]['current_1rm'] == EXPECTED_W3
+        assert plan[4]['current_1rm'] == EXPECTED_W3
 
     def test_multiple_amrap_updates(self):
         """Multiple AMRAP results should progressively update 1RM."""
         start_1rm = 300.0
 
         amrap_results = {
-            2: {'weight': 225.0, 'actual_reps': 10},  # New 1RM: 375 (225 * (1 + 20/30))
-            3: {'weight': 300.0, 'actual_reps': 8},   # New 1RM: 460 (300 * (1 + 16/30))
+            2: {'weight': 225.0, 'actual_reps': 10},  # New 1RM: EXPECTED_W3
+            3: {'weight': 300.0, 'actual_reps': 8},   # New 1RM: EXPECTED_W4
         }
 
-        plan = build_training_plan(start_1rm=start_1rm, amrap_results=amrap_results)
+        plan = _cached_plan(start_1rm=start_1rm, amrap_results=amrap_results)
 
         # Week 2 uses start 1RM
         assert plan[2]['current_1rm'] == 300.0
 
-        # Week 3 uses 1RM from week 2 AMRAP (375)
-        assert plan[3]['current_1rm'] == pytest.approx(375.0)
+        # Week 3 uses 1RM from week 2 AMRAP
+        assert plan[3]['current_1rm'] == EXPECTED_W3
 
-        # Week 4 uses 1RM from week 3 AMRAP (460)
-        # Week 3: 8 reps at 300 lbs → effective reps = 16 → 300 * (1 + 16/30) = 460
-        assert plan[4]['current_1rm'] == pytest.approx(460.0)
+        # Week 4 uses 1RM from week 3 AMRAP
+        assert plan[4]['current_1rm'] == EXPECTED_W4
+
+    def test_expected_1rms_match_hand_computed_values(self):
+        """The derived 1RM constants should equal the documented 375 and 460 lbs."""
+        # 225 × (1 + 20/30) and 300 × (1 + 16/30) are not exact in IEEE 754
+        assert isclose(EXPECTED_W3, 375.0, rel_tol=1e-12)
+        assert isclose(EXPECTED_W4, 460.0, rel_tol=1e-12)
 
     def test_custom_block_percentages(self):
         """Should accept and use custom block percentages."""
@@ -133,28 +221,66 @@ class TestBuildTrainingPlan:
         assert plan[5]['percentage'] == 0.7
         assert plan[9]['percentage'] == 0.75
 
+    def test_default_fast_path_matches_full_build(self):
+        """Scaled default plan should equal a plan built from explicit defaults."""
+        explicit_percentages = [
+            [0.7, 0.75, 0.8, 0.725],
+            [0.775, 0.825, 0.85, 0.775],
+            [0.8, 0.85, 0.875, 0.9, 0.65]
+        ]
+
+        for start_1rm in (1.0, 137.5, 300.0, 412.3):
+            assert build_training_plan(start_1rm) == build_training_plan(
+                start_1rm, block_percentages=explicit_percentages
+            )
+
+    def test_repeated_calls_return_independent_plans(self):
+        """Mutating one returned plan should not affect later calls."""
+        plan = build_training_plan(start_1rm=300.0)
+        plan[1] = None
+
+        assert build_training_plan(start_1rm=300.0)[1]['prescribed_weight'] == 210.0
+
+    def test_tuple_block_percentages(self):
+        """Should accept block percentages given as a tuple of tuples."""
+        custom_percentages = (
+            (0.6, 0.65, 0.7, 0.65),
+            (0.7, 0.75, 0.8, 0.75),
+            (0.75, 0.8, 0.85, 0.9, 0.6)
+        )
+
+        plan = build_training_plan(start_1rm=300.0, block_percentages=custom_percentages)
+
+        assert plan[1]['percentage'] == 0.6
+        assert plan[13]['percentage'] == 0.6
+
     def test_prescribed_weight_calculation(self):
         """Prescribed weight should be current_1rm * percentage."""
         start_1rm = 400.0
-        plan = build_training_plan(start_1rm=start_1rm)
+        plan = _cached_plan(start_1rm=start_1rm)
 
-        for week in range(1, 14):
-            expected_weight = plan[week]['current_1rm'] * plan[week]['percentage']
-            assert abs(plan[week]['prescribed_weight'] - expected_weight) < 0.01
+        assert _validate_plan_shape(plan).prescribed_ok
 
-    def test_amrap_results_with_default_tut(self):
-        """AMRAP results should use default TUT values if not provided."""
-        start_1rm = 300.0
-        amrap_results = {
-            2: {'weight': 225.0, 'actual_reps': 10}  # Missing TUT params
-        }
+    def test_plan_values_are_python_scalars(self):
+        """Plan entries should hold built-in Python types, not NumPy scalars."""
+        amrap_results = {2: {'weight': 225.0, 'actual_reps': 10}}
+        plan = _cached_plan(start_1rm=300.0, amrap_results=amrap_results)
 
-        plan = build_training_plan(start_1rm=start_1rm, amrap_results=amrap_results)
+        for week in range(1, 14):
+            assert type(plan[week]['prescribed_weight']) is float
+            assert type(plan[week]['percentage']) is float
+            assert type(plan[week]['current_1rm']) is float
+            assert type(plan[week]['sets']) is int
+            assert type(plan[week]['is_amrap_week']) is bool
 
+    def test_amrap_results_with_default_tut(self, plan_300_w2_amrap):
+        """AMRAP results should use default TUT values if not provided."""
         # Should use defaults: tut_per_rep=6.0, normal_tempo=3.0
-        # Effective reps = 10 * (6/3) = 20
-        # New 1RM = 225 * (1 + 20/30) = 375
-        assert plan[3]['current_1rm'] == pytest.approx(375.0)
+        explicit_tut = {
+            2: {'weight': 225.0, 'actual_reps': 10, 'tut_per_rep': 6.0, 'normal_tempo': 3.0}
+        }
+        assert plan_300_w2_amrap[3]['current_1rm'] == EXPECTED_W3
+        assert plan_300_w2_amrap == _cached_plan(start_1rm=300.0, amrap_results=explicit_tut)
 
     def test_zero_reps_amrap(self):
         """AMRAP with 0 reps should set 1RM to the attempted weight."""
@@ -163,160 +289,189 @@ class TestBuildTrainingPlan:
             2: {'weight': 300.0, 'actual_reps': 0}
         }
 
-        plan = build_training_plan(start_1rm=start_1rm, amrap_results=amrap_results)
+        plan = _cached_plan(start_1rm=start_1rm, amrap_results=amrap_results)
 
         # Week 3 should use the weight as new 1RM (since 0 reps)
         assert plan[3]['current_1rm'] == 300.0
 
-    def test_invalid_start_1rm(self):
-        """Should raise ValueError for non-positive start_1rm."""
-        with pytest.raises(ValueError, match="start_1rm must be positive"):
-            build_training_plan(start_1rm=0)
-
-        with pytest.raises(ValueError, match="start_1rm must be positive"):
-            build_training_plan(start_1rm=-100)
-
-    def test_invalid_block_percentages_length(self):
-        """Should raise ValueError if block_percentages doesn't have 3 blocks."""
-        invalid_percentages = [
+    @pytest.mark.parametrize("kwargs, pattern", [
+        pytest.param(dict(start_1rm=0), POS_START_1RM, id="zero-start-1rm"),
+        pytest.param(dict(start_1rm=-100), POS_START_1RM, id="negative-start-1rm"),
+        pytest.param(dict(start_1rm=-1e-9), POS_START_1RM, id="tiny-negative-start-1rm"),
+        pytest.param(dict(start_1rm=300.0, block_percentages="0.7,0.75"), BLOCKS_TYPE,
+                     id="block-percentages-type"),
+        pytest.param(dict(start_1rm=300.0, block_percentages=[
             [0.7, 0.75, 0.8, 0.725],
             [0.775, 0.825, 0.85, 0.775]
             # Missing Block 3
-        ]
-
-        with pytest.raises(ValueError, match="must contain exactly 3 blocks"):
-            build_training_plan(start_1rm=300.0, block_percentages=invalid_percentages)
-
-    def test_invalid_block_percentages_weeks(self):
-        """Should raise ValueError if block weeks are incorrect."""
-        invalid_percentages = [
+        ]), THREE_BLOCKS, id="block-percentages-length"),
+        pytest.param(dict(start_1rm=300.0, block_percentages=[
             [0.7, 0.75, 0.8],  # Only 3 weeks instead of 4
             [0.775, 0.825, 0.85, 0.775],
             [0.8, 0.85, 0.875, 0.9, 0.65]
-        ]
-
-        with pytest.raises(ValueError, match="must have 4, 4, and 5 weeks"):
-            build_training_plan(start_1rm=300.0, block_percentages=invalid_percentages)
-
-    def test_missing_amrap_keys(self):
-        """Should raise ValueError if AMRAP data is missing required keys."""
-        amrap_results = {
+        ]), BLOCK_WEEKS, id="block-percentages-weeks"),
+        pytest.param(dict(start_1rm=300.0, amrap_results={
             2: {'weight': 225.0}  # Missing 'actual_reps'
+        }), AMRAP_KEYS, id="missing-amrap-keys"),
+    ])
+    def test_invalid_inputs_raise_error(self, kwargs, pattern):
+        """Should raise ValueError for a bad start 1RM, block layout or AMRAP entry."""
+        with pytest.raises(ValueError, match=pattern):
+            build_training_plan(**kwargs)
+
+    def test_amrap_keys_validated_before_estimating(self):
+        """Malformed later checkpoints should be reported before any 1RM is estimated."""
+        amrap_results = {
+            2: {'weight': -225.0, 'actual_reps': 10},
+            6: {'weight': 250.0}  # Missing 'actual_reps'
         }
 
-        with pytest.raises(ValueError, match="must contain 'weight' and 'actual_reps'"):
+        with pytest.raises(ValueError, match="AMRAP data for week 6 must contain"):
             build_training_plan(start_1rm=300.0, amrap_results=amrap_results)
 
-    def test_integration_full_program(self):
+    @pytest.mark.slow
+    def test_integration_full_program(self, plan_integration, integration_expected_1rm):
         """Integration test: Complete 13-week program with multiple AMRAP updates."""
-        start_1rm = 300.0
+        plan = plan_integration
 
-        # Simulate AMRAP results across all AMRAP weeks
-        amrap_results = {
-            2: {'weight': 225.0, 'actual_reps': 10},  # Block 1
-            3: {'weight': 281.25, 'actual_reps': 8},
-            4: {'weight': 300.0, 'actual_reps': 7},
-            6: {'weight': 310.0, 'actual_reps': 9},   # Block 2
-            7: {'weight': 330.0, 'actual_reps': 7},
-            8: {'weight': 340.0, 'actual_reps': 6},
-            10: {'weight': 350.0, 'actual_reps': 8},  # Block 3
-            11: {'weight': 360.0, 'actual_reps': 7},
-            12: {'weight': 370.0, 'actual_reps': 5},
-        }
+        # Verify plan structure
+        shape = _validate_plan_shape(plan)
+        assert shape.weeks == list(range(1, 14))
+        assert shape.keys_ok and shape.prescribed_ok
 
-        plan = build_training_plan(start_1rm=start_1rm, amrap_results=amrap_results)
+        # Compare every week against the oracle in one bulk check per field
+        def column(key, dtype):
+            return np.fromiter((plan[w][key] for w in range(1, 14)), dtype=dtype, count=13)
 
-        # Verify plan structure
-        assert len(plan) == 13
-        assert all('prescribed_weight' in plan[w] for w in range(1, 14))
-        assert all('current_1rm' in plan[w] for w in range(1, 14))
-        assert all('percentage' in plan[w] for w in range(1, 14))
-        assert all('sets' in plan[w] for w in range(1, 14))
-        assert all('is_amrap_week' in plan[w] for w in range(1, 14))
+        np.testing.assert_allclose(column('current_1rm', np.float64), integration_expected_1rm, rtol=1e-9)
+        np.testing.assert_array_equal(column('percentage', np.float64), EXPECTED_PCTS_ARRAY)
+        np.testing.assert_array_equal(column('sets', np.int64), EXPECTED_SETS_ARRAY)
+        np.testing.assert_array_equal(column('is_amrap_week', np.bool_), EXPECTED_AMRAP_ARRAY)
+        np.testing.assert_allclose(column('prescribed_weight', np.float64),
+                                   integration_expected_1rm * EXPECTED_PCTS_ARRAY, rtol=1e-9)
 
-        # Verify 1RM progression (should increase over time with good AMRAP performance)
-        assert plan[5]['current_1rm'] > plan[1]['current_1rm']  # Block 2 start > Block 1 start
-        assert plan[9]['current_1rm'] > plan[5]['current_1rm']  # Block 3 start > Block 2 start
 
-        # Verify deload week has lower intensity
-        assert plan[13]['percentage'] == 0.65
-        assert plan[13]['prescribed_weight'] < plan[12]['prescribed_weight']
+class TestWeekPlan:
+    """Test suite for the WeekPlan record returned by build_training_plan()."""
+
+    @pytest.fixture
+    def week_plan(self, plan_300):
+        return plan_300[1]
+
+    def test_attribute_access(self, week_plan):
+        """Fields should be readable as attributes."""
+        assert isinstance(week_plan, WeekPlan)
+        assert week_plan.prescribed_weight == 210.0
+        assert week_plan.percentage == 0.7
+        assert week_plan.current_1rm == 300.0
+        assert week_plan.sets == 3
+        assert week_plan.is_amrap_week is False
+
+    def test_mapping_access(self, week_plan):
+        """Fields should also be readable by key, like the previous dict output."""
+        assert week_plan['sets'] == 3
+        assert 'prescribed_weight' in week_plan
+        assert list(week_plan.keys()) == [
+            'prescribed_weight', 'percentage', 'current_1rm', 'sets', 'is_amrap_week'
+        ]
+        with pytest.raises(KeyError):
+            week_plan['asdict']
+
+    def test_asdict(self, week_plan):
+        """asdict() should return a plain dict with every field."""
+        assert week_plan.asdict() == {
+            'prescribed_weight': 210.0,
+            'percentage': 0.7,
+            'current_1rm': 300.0,
+            'sets': 3,
+            'is_amrap_week': False
+        }
+
+    def test_equals_plain_dict(self, week_plan):
+        """A WeekPlan should compare equal to the dict of its fields."""
+        assert week_plan == week_plan.asdict()
+        assert week_plan != {**week_plan.asdict(), 'sets': 4}
+        assert week_plan == dataclasses.replace(week_plan)
+
+    def test_unknown_key_raises_key_error(self, week_plan):
+        """Only field names should be readable by key."""
+        with pytest.raises(KeyError):
+            week_plan['asdict']
+
+    def test_is_slotted(self, week_plan):
+        """WeekPlan should carry no per-instance __dict__."""
+        assert not hasattr(week_plan, '__dict__')
 
 
 class TestSuggestNextWeekWorkout:
     """Test suite for suggest_next_week_workout() function."""
 
-    @pytest.fixture
-    def sample_plan(self):
-        """Create a sample training plan for testing."""
-        return build_training_plan(start_1rm=300.0)
+    def test_accepts_plain_dict_plan(self, plan_300):
+        """Dict-of-dict plans (e.g. asdict() after a JSON round trip) should still work."""
+        dict_plan = {week: week_data.asdict() for week, week_data in plan_300.items()}
+        for week in (1, 2):
+            assert suggest_next_week_workout(week, "Squat", dict_plan) == \
+                suggest_next_week_workout(week, "Squat", plan_300)
+        assert suggest_next_week_workouts_all(2, dict_plan) == suggest_next_week_workouts_all(2, plan_300)
 
-    def test_returns_all_required_fields(self, sample_plan):
+    def test_returns_all_required_fields(self, plan_300):
         """Should return all required workout prescription fields."""
-        workout = suggest_next_week_workout(1, "Squat", sample_plan)
+        workout = suggest_next_week_workout(1, "Squat", plan_300)
 
-        assert 'week' in workout
-        assert 'lift' in workout
-        assert 'sets' in workout
-        assert 'target_reps' in workout
-        assert 'weight' in workout
-        assert 'is_amrap_week' in workout
-        assert 'instructions' in workout
+        assert REQUIRED_WORKOUT_KEYS <= workout.keys()
 
-    def test_week1_squat_prescription(self, sample_plan):
+    def test_week1_squat_prescription(self, plan_300):
         """Should generate correct prescription for Week 1 Squat."""
-        workout = suggest_next_week_workout(1, "Squat", sample_plan)
-
-        assert workout['week'] == 1
-        assert workout['lift'] == "Squat"
-        assert workout['sets'] == 3  # Block 1
-        assert workout['target_reps'] == "9-12"  # Squat/Bench range
-        assert workout['weight'] == 210.0  # 300 * 0.7
-        assert workout['is_amrap_week'] is False
-
-    def test_week2_amrap_instructions(self, sample_plan):
+        workout = suggest_next_week_workout(1, "Squat", plan_300)
+        week, lift, sets, target_reps, weight, is_amrap_week = (
+            workout['week'], workout['lift'], workout['sets'],
+            workout['target_reps'], workout['weight'], workout['is_amrap_week']
+        )
+
+        assert week == 1
+        assert lift == "Squat"
+        assert sets == 3  # Block 1
+        assert target_reps == "9-12"  # Squat/Bench range
+        assert weight == 210.0  # 300 * 0.7
+        assert is_amrap_week is False
+
+    def test_week2_amrap_instructions(self, plan_300):
         """Should include AMRAP instructions for Week 2."""
-        workout = suggest_next_week_workout(2, "Squat", sample_plan)
+        workout = suggest_next_week_workout(2, "Squat", plan_300)
+        instructions = workout['instructions']
 
         assert workout['is_amrap_week'] is True
-        assert "AMRAP" in workout['instructions']
-        assert "final set" in workout['instructions']
+        assert "AMRAP" in instructions
+        assert "final set" in instructions
 
-    def test_week5_block2_sets(self, sample_plan):
+    def test_week5_block2_sets(self, plan_300):
         """Should prescribe 4 sets for Block 2."""
-        workout = suggest_next_week_workout(5, "Bench Press", sample_plan)
+        workout = suggest_next_week_workout(5, "Bench Press", plan_300)
 
         assert workout['sets'] == 4
         assert workout['week'] == 5
 
-    def test_week10_block3_sets(self, sample_plan):
+    def test_week10_block3_sets(self, plan_300):
         """Should prescribe 5 sets for Block 3."""
-        workout = suggest_next_week_workout(10, "Pull-ups", sample_plan)
+        workout = suggest_next_week_workout(10, "Pull-ups", plan_300)
 
         assert workout['sets'] == 5
         assert workout['week'] == 10
 
-    def test_pullups_rep_range(self, sample_plan):
-        """Pull-ups should have 10-15 rep range."""
-        workout = suggest_next_week_workout(1, "Pull-ups", sample_plan)
-
-        assert workout['target_reps'] == "10-15"
-
-    def test_squat_rep_range(self, sample_plan):
-        """Squat should have 9-12 rep range."""
-        workout = suggest_next_week_workout(1, "Squat", sample_plan)
-
-        assert workout['target_reps'] == "9-12"
+    @pytest.mark.parametrize("lift, target_reps", [
+        ("Squat", "9-12"),
+        ("Bench Press", "9-12"),
+        ("Pull-ups", "10-15"),
+    ], ids=["squat", "bench-press", "pull-ups"])
+    def test_rep_range(self, plan_300, lift, target_reps):
+        """Squat and Bench Press should use 9-12 reps, Pull-ups 10-15."""
+        workout = suggest_next_week_workout(1, lift, plan_300)
 
-    def test_bench_press_rep_range(self, sample_plan):
-        """Bench Press should have 9-12 rep range."""
-        workout = suggest_next_week_workout(1, "Bench Press", sample_plan)
+        assert workout['target_reps'] == target_reps
 
-        assert workout['target_reps'] == "9-12"
-
-    def test_instructions_format(self, sample_plan):
+    def test_instructions_format(self, plan_300):
         """Instructions should be properly formatted."""
-        workout = suggest_next_week_workout(1, "Squat", sample_plan)
+        workout = suggest_next_week_workout(1, "Squat", plan_300)
 
         instructions = workout['instructions']
         assert "Week 1" in instructions
@@ -325,84 +480,112 @@ class TestSuggestNextWeekWorkout:
         assert "9-12 reps" in instructions
         assert "210.0 lbs" in instructions
 
-    def test_amrap_weeks_have_special_instructions(self, sample_plan):
+    def test_instructions_exact_text(self, plan_300):
+        """Instructions should match the documented layout line for line."""
+        workout = suggest_next_week_workout(2, "Pull-ups", plan_300)
+
+        assert workout['instructions'] == (
+            "Week 2 - Pull-ups Workout\n"
+            "Sets: 3 sets\n"
+            "Reps: 10-15 reps per set\n"
+            "Weight: 225.0 lbs\n"
+            "\n"
+            "SPECIAL: Perform AMRAP (as many reps as possible) on the final set"
+        )
+
+    @pytest.mark.parametrize("week", [2, 3, 4, 6, 7, 8, 10, 11, 12], ids=lambda week: f"week{week}")
+    def test_amrap_weeks_have_special_instructions(self, plan_300, week):
         """All AMRAP weeks should have special instructions."""
-        amrap_weeks = [2, 3, 4, 6, 7, 8, 10, 11, 12]
-
-        for week in amrap_weeks:
-            workout = suggest_next_week_workout(week, "Squat", sample_plan)
-            assert workout['is_amrap_week'] is True
-            assert "SPECIAL" in workout['instructions']
-            assert "AMRAP" in workout['instructions']
+        workout = suggest_next_week_workout(week, "Squat", plan_300)
+        instructions = workout['instructions']
+        assert workout['is_amrap_week'] is True
+        assert "SPECIAL" in instructions
+        assert "AMRAP" in instructions
 
-    def test_non_amrap_weeks_no_special_instructions(self, sample_plan):
+    @pytest.mark.parametrize("week", [1, 5, 9, 13], ids=lambda week: f"week{week}")
+    def test_non_amrap_weeks_no_special_instructions(self, plan_300, week):
         """Non-AMRAP weeks should not have special instructions."""
-        non_amrap_weeks = [1, 5, 9, 13]
-
-        for week in non_amrap_weeks:
-            workout = suggest_next_week_workout(week, "Squat", sample_plan)
-            assert workout['is_amrap_week'] is False
-            assert "SPECIAL" not in workout['instructions']
-
-    def test_week13_deload(self, sample_plan):
-        """Week 13 should show deload weight."""
-        workout = suggest_next_week_workout(13, "Squat", sample_plan)
-
-        assert workout['week'] == 13
-        assert workout['sets'] == 5  # Still Block 3
-        assert workout['weight'] == 195.0  # 300 * 0.65 (deload)
+        workout = suggest_next_week_workout(week, "Squat", plan_300)
         assert workout['is_amrap_week'] is False
+        assert "SPECIAL" not in workout['instructions']
 
-    def test_invalid_week_below_range(self, sample_plan):
-        """Should raise ValueError for week < 1."""
-        with pytest.raises(ValueError, match="current_week must be between 1 and 13"):
-            suggest_next_week_workout(0, "Squat", sample_plan)
-
-    def test_invalid_week_above_range(self, sample_plan):
-        """Should raise ValueError for week > 13."""
-        with pytest.raises(ValueError, match="current_week must be between 1 and 13"):
-            suggest_next_week_workout(14, "Squat", sample_plan)
-
-    def test_invalid_lift_name(self, sample_plan):
-        """Should raise ValueError for invalid lift name."""
-        with pytest.raises(ValueError, match="lift_name must be one of"):
-            suggest_next_week_workout(1, "Deadlift", sample_plan)
+    def test_week13_deload(self, plan_300):
+        """Week 13 should show deload weight."""
+        workout = suggest_next_week_workout(13, "Squat", plan_300)
+        week, sets, weight, is_amrap_week = (
+            workout['week'], workout['sets'], workout['weight'], workout['is_amrap_week']
+        )
+
+        assert week == 13
+        assert sets == 5  # Still Block 3
+        assert weight == 195.0  # 300 * 0.65 (deload)
+        assert is_amrap_week is False
+
+    @pytest.mark.parametrize("week, lift, pattern", [
+        pytest.param(0, "Squat", WEEK_RANGE, id="week-below-range"),
+        pytest.param(14, "Squat", WEEK_RANGE, id="week-above-range"),
+        pytest.param(1, "Deadlift", LIFT_NAME, id="invalid-lift-name"),
+    ])
+    def test_invalid_inputs_raise_error(self, plan_300, week, lift, pattern):
+        """Should raise ValueError for an out-of-range week or unknown lift."""
+        with pytest.raises(ValueError, match=pattern):
+            suggest_next_week_workout(week, lift, plan_300)
 
     def test_week_not_in_plan(self):
         """Should raise ValueError if week not in training plan."""
         # Create a plan that's missing week 2
         incomplete_plan = {1: {'prescribed_weight': 210, 'sets': 3, 'is_amrap_week': False}}
 
-        with pytest.raises(ValueError, match="Week 2 not found in training_plan"):
+        with pytest.raises(ValueError, match=WEEK_MISSING):
             suggest_next_week_workout(2, "Squat", incomplete_plan)
 
-    def test_all_three_lifts(self, sample_plan):
+    def test_all_three_lifts(self, plan_300):
         """Should work for all three lift types."""
         lifts = ["Squat", "Bench Press", "Pull-ups"]
 
         for lift in lifts:
-            workout = suggest_next_week_workout(1, lift, sample_plan)
+            workout = suggest_next_week_workout(1, lift, plan_300)
             assert workout['lift'] == lift
             assert 'instructions' in workout
 
-    def test_progression_across_weeks(self, sample_plan):
+    def test_progression_across_weeks(self, plan_300):
         """Should show weight progression across weeks within a block."""
-        week1 = suggest_next_week_workout(1, "Squat", sample_plan)
-        week2 = suggest_next_week_workout(2, "Squat", sample_plan)
-        week3 = suggest_next_week_workout(3, "Squat", sample_plan)
+        week1 = suggest_next_week_workout(1, "Squat", plan_300)
+        week2 = suggest_next_week_workout(2, "Squat", plan_300)
+        week3 = suggest_next_week_workout(3, "Squat", plan_300)
 
         # Week 3 should have higher weight than Week 1 (80% vs 70%)
         assert week3['weight'] > week1['weight']
 
-    def test_integration_with_updated_1rm(self):
+    def test_integration_with_updated_1rm(self, plan_300_w2_amrap):
         """Should work with training plan that has updated 1RMs."""
-        # Create plan with AMRAP results
-        amrap_results = {
-            2: {'weight': 225.0, 'actual_reps': 10}
-        }
-        plan = build_training_plan(start_1rm=300.0, amrap_results=amrap_results)
-
         # Week 3 should use updated 1RM from week 2
-        workout = suggest_next_week_workout(3, "Squat", plan)
-        # 375 * 0.8 = 300 (updated 1RM from AMRAP)
-        assert workout['weight'] == pytest.approx(300.0)
+        workout = suggest_next_week_workout(3, "Squat", plan_300_w2_amrap)
+        # Updated 1RM from AMRAP × week 3 intensity (0.8)
+        assert workout['weight'] == EXPECTED_W3 * 0.8
+
+
+class TestSuggestNextWeekWorkoutsAll:
+    """Test suite for suggest_next_week_workouts_all() function."""
+
+    def test_returns_all_lifts(self, plan_300):
+        """Should return one prescription per lift, in a stable order."""
+        workouts = suggest_next_week_workouts_all(1, plan_300)
+        assert list(workouts) == ["Squat", "Bench Press", "Pull-ups"]
+
+    @pytest.mark.parametrize("week", [1, 2, 5, 13])
+    def test_matches_single_lift_api(self, plan_300, week):
+        """Each entry should equal the single-lift prescription."""
+        workouts = suggest_next_week_workouts_all(week, plan_300)
+        for lift, workout in workouts.items():
+            assert workout == suggest_next_week_workout(week, lift, plan_300)
+
+    def test_invalid_week_raises_error(self, plan_300):
+        """Should raise ValueError for weeks outside 1-13."""
+        with pytest.raises(ValueError, match=WEEK_RANGE):
+            suggest_next_week_workouts_all(14, plan_300)
+
+    def test_week_missing_from_plan_raises_error(self, plan_300):
+        """Should raise ValueError when the week is absent from the plan."""
+        with pytest.raises(ValueError, match=WEEK_MISSING):
+            suggest_next_week_workouts_all(2, {1: plan_300[1]})
@@ -0,0 +1,25 @@
+"""
+Tests for the shared program structure tables.
+"""
+
+import pytest
+from src.training.program import TARGET_REPS, WEEK_IN_BLOCK, WEEK_TO_BLOCK_IDX, WEEK_TO_SETS
+
+
+class TestProgramTables:
+    """Test suite for the week-indexed program tables."""
+
+    @pytest.mark.parametrize("table", [WEEK_TO_BLOCK_IDX, WEEK_IN_BLOCK, WEEK_TO_SETS])
+    def test_tables_cover_13_weeks(self, table):
+        """Each table should be indexed by week number 1-13, with index 0 unused."""
+        assert len(table) == 14
+        assert table[0] is None
+
+    def test_sets_step_up_per_block(self):
+        """Sets should be 3, 4 and 5 in blocks 1, 2 and 3."""
+        for week in range(1, 14):
+            assert WEEK_TO_SETS[week] == WEEK_TO_BLOCK_IDX[week] + 3
+
+    def test_target_reps_lift_order(self):
+        """Lifts should be listed in display order."""
+        assert list(TARGET_REPS) == ["Squat", "Bench Press", "Pull-ups"]
@@ -2,14 +2,23 @@
 Tests for performance tracking functions.
 """
 
+import io
+import shutil
+import numpy as np
 import pytest
 import pandas as pd
-import tempfile
 from pathlib import Path
+from unittest import mock
+from src.training import tracker
 from src.training.tracker import (
+    block_from_week_vec,
+    build_lift_index,
+    build_performance_index,
     get_block_from_week,
     initialize_performance_log,
     log_performance,
+    log_performance_batch,
+    PerformanceLogger,
     track_weekly_performance,
     save_performance_log,
     load_performance_log,
@@ -19,41 +28,74 @@ from src.training.tracker import (
     get_latest_1rm_by_lift
 )
 
+_EMPTY_LOG = initialize_performance_log()
+_LOG_FIELDS = ['week', 'lift', 'weight', 'reps', 'total_tut', 'rpe']
+
+
+def _bulk_log(rows):
+    """Build a performance log from (week, lift, weight, reps, total_tut, rpe) tuples in one batch."""
+    return log_performance_batch(_EMPTY_LOG.copy(), pd.DataFrame(rows, columns=_LOG_FIELDS))
+
+
+@pytest.fixture(scope="session")
+def log_dir(tmp_path_factory):
+    """Directory shared by the save/load tests; each test writes its own file names."""
+    return tmp_path_factory.mktemp("logs")
+
 
 class TestGetBlockFromWeek:
     """Test suite for get_block_from_week() function."""
 
-    def test_block1_weeks(self):
-        """Weeks 1-4 should be in block 1."""
-        assert get_block_from_week(1) == 1
-        assert get_block_from_week(2) == 1
-        assert get_block_from_week(3) == 1
-        assert get_block_from_week(4) == 1
-
-    def test_block2_weeks(self):
-        """Weeks 5-8 should be in block 2."""
-        assert get_block_from_week(5) == 2
-        assert get_block_from_week(6) == 2
-        assert get_block_from_week(7) == 2
-        assert get_block_from_week(8) == 2
-
-    def test_block3_weeks(self):
-        """Weeks 9-13 should be in block 3."""
-        assert get_block_from_week(9) == 3
-        assert get_block_from_week(10) == 3
-        assert get_block_from_week(11) == 3
-        assert get_block_from_week(12) == 3
-        assert get_block_from_week(13) == 3
-
-    def test_invalid_week_below_range(self):
-        """Should raise ValueError for week < 1."""
+    @pytest.mark.parametrize("week,block", [
+        *[(week, 1) for week in range(1, 5)],
+        *[(week, 2) for week in range(5, 9)],
+        *[(week, 3) for week in range(9, 14)],
+    ])
+    def test_week_maps_to_block(self, week, block):
+        """Weeks 1-4 are block 1, weeks 5-8 block 2, and weeks 9-13 block 3."""
+        assert get_block_from_week(week) == block
+
+    @pytest.mark.parametrize("week,block", [(2.0, 1), (5.0, 2), (13.0, 3)])
+    def test_integral_float_week(self, week, block):
+        """Whole-number floats (e.g. weeks read from CSV or JSON) should map like ints."""
+        assert get_block_from_week(week) == block
+
+    def test_fractional_week(self):
+        """Non-integral weeks should raise ValueError."""
+        with pytest.raises(ValueError, match="week must be a whole number"):
+            get_block_from_week(2.5)
+
+    @pytest.mark.parametrize("week", [0, 14, -1, 100])
+    def test_invalid_week(self, week):
+        """Should raise ValueError for weeks outside 1-13."""
         with pytest.raises(ValueError, match="week must be between 1 and 13"):
-            get_block_from_week(0)
+            get_block_from_week(week)
+
+
+class TestBlockFromWeekVec:
+    """Test suite for block_from_week_vec() function."""
 
-    def test_invalid_week_above_range(self):
-        """Should raise ValueError for week > 13."""
+    def test_matches_scalar_version(self):
+        """Vectorized blocks should match get_block_from_week() for every week."""
+        weeks = list(range(1, 14))
+        result = block_from_week_vec(weeks)
+        assert result.tolist() == [get_block_from_week(week) for week in weeks]
+
+    def test_returns_int8_array(self):
+        """Result should be a compact int8 array."""
+        assert block_from_week_vec([1, 5, 9]).dtype == 'int8'
+
+    def test_accepts_log_week_column(self):
+        """The int8 week column of a log should map directly to blocks."""
+        weeks = np.array([13, 1, 8, 9, 4, 5], dtype=np.int8)
+        assert block_from_week_vec(weeks).tolist() == [3, 1, 2, 3, 1, 2]
+
+    def test_invalid_week_raises_error(self):
+        """Any out-of-range week should raise ValueError."""
         with pytest.raises(ValueError, match="week must be between 1 and 13"):
-            get_block_from_week(14)
+            block_from_week_vec([1, 14])
+        with pytest.raises(ValueError, match="week must be between 1 and 13"):
+            block_from_week_vec([0, 5])
 
 
 class TestInitializePerformanceLog:
@@ -61,31 +103,41 @@ class TestInitializePerformanceLog:
 
     def test_creates_empty_dataframe(self):
         """Should create an empty DataFrame."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 0
 
     def test_has_correct_columns(self):
         """Should have all required columns."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG
         expected_columns = ['week', 'block', 'lift', 'weight', 'reps', 'total_tut', 'rpe', 'estimated_1rm']
         assert df.columns.tolist() == expected_columns
 
     def test_column_order(self):
         """Columns should be in the correct order."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG
         assert df.columns[0] == 'week'
         assert df.columns[1] == 'block'
         assert df.columns[2] == 'lift'
         assert df.columns[-1] == 'estimated_1rm'
 
+    def test_compact_dtypes(self):
+        """Should start with the compact schema and a categorical lift column."""
+        df = _EMPTY_LOG
+        assert df['week'].dtype == 'int8'
+        assert df['block'].dtype == 'int8'
+        assert df['lift'].cat.categories.tolist() == ["Squat", "Bench Press", "Pull-ups"]
+        assert df['weight'].dtype == 'float32'
+        assert df['reps'].dtype == 'int16'
+        assert df['estimated_1rm'].dtype == 'float32'
+
 
 class TestLogPerformance:
     """Test suite for log_performance() function."""
 
     def test_adds_single_record(self):
         """Should successfully add a single record."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         df = log_performance(df, week=1, lift="Squat", weight=225.0, reps=10, total_tut=60.0, rpe=7.5)
 
         assert len(df) == 1
@@ -98,7 +150,7 @@ class TestLogPerformance:
 
     def test_auto_calculates_block(self):
         """Should automatically determine the correct block."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
         assert df.iloc[0]['block'] == 1
 
@@ -110,14 +162,14 @@ class TestLogPerformance:
 
     def test_auto_calculates_estimated_1rm(self):
         """Should automatically calculate estimated 1RM."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         # 10 reps at 225 lbs with 6s TUT → effective reps = 20 → 1RM = 225 * (1 + 20/30) = 375
         df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
         assert df.iloc[0]['estimated_1rm'] == pytest.approx(375.0)
 
     def test_adds_multiple_records(self):
         """Should handle multiple records correctly."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
         df = log_performance(df, week=1, lift="Bench Press", weight=185, reps=12, total_tut=72, rpe=8)
         df = log_performance(df, week=2, lift="Squat", weight=240, reps=8, total_tut=48, rpe=8.5)
@@ -129,7 +181,7 @@ class TestLogPerformance:
 
     def test_different_lifts(self):
         """Should handle different lift types."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
         df = log_performance(df, week=1, lift="Bench Press", weight=185, reps=12, total_tut=72, rpe=7)
         df = log_performance(df, week=1, lift="Pull-ups", weight=200, reps=15, total_tut=90, rpe=6)
@@ -142,7 +194,7 @@ class TestLogPerformance:
 
     def test_zero_reps(self):
         """Should handle 0 reps (failed attempt)."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         df = log_performance(df, week=1, lift="Squat", weight=300, reps=0, total_tut=0, rpe=10)
 
         assert len(df) == 1
@@ -151,63 +203,391 @@ class TestLogPerformance:
 
     def test_custom_tut_parameters(self):
         """Should accept custom TUT parameters."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         df = log_performance(df, week=1, lift="Squat", weight=225, reps=10,
                            total_tut=60, rpe=7, tut_per_rep=5.0, normal_tempo=2.5)
         assert len(df) == 1
         # Custom TUT calculation: effective reps = 10 * (5/2.5) = 20
         assert df.iloc[0]['estimated_1rm'] == pytest.approx(375.0)
 
-    def test_invalid_week_below_range(self):
-        """Should raise ValueError for week < 1."""
-        df = initialize_performance_log()
+    @pytest.mark.parametrize("formula,expected", [("brzycki", 300.0), ("fitbod", 348.50)])
+    def test_formula_selects_1rm_estimate(self, formula, expected):
+        """formula= should pick the 1RM formula (Brzycki on the 10 actual reps, Fitbod on 20 effective)."""
+        df = log_performance(_EMPTY_LOG.copy(), week=1, lift="Squat", weight=225, reps=10,
+                             total_tut=60, rpe=7, formula=formula)
+        assert df.iloc[0]['estimated_1rm'] == pytest.approx(expected, rel=0.001)
+
+    def test_brzycki_accepts_high_rep_sets(self):
+        """Brzycki should not reject sets whose TUT-adjusted reps exceed its 37-rep limit."""
+        df = log_performance(_EMPTY_LOG.copy(), week=1, lift="Squat", weight=100, reps=19,
+                             total_tut=114, rpe=9, formula="brzycki")
+        assert df.iloc[0]['estimated_1rm'] == pytest.approx(200.0)
+
+    def test_brzycki_rejects_tempo_arguments(self):
+        """Tempo arguments, which Brzycki ignores, should be rejected on every logging path."""
+        record = dict(week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+        with pytest.raises(ValueError, match="no effect with the brzycki formula"):
+            log_performance(_EMPTY_LOG.copy(), **record, tut_per_rep=5.0, formula="brzycki")
+        with pytest.raises(ValueError, match="no effect with the brzycki formula"):
+            log_performance(PerformanceLogger(), **record, normal_tempo=2.5, formula="brzycki")
+        with pytest.raises(ValueError, match="no effect with the brzycki formula"):
+            log_performance_batch(_EMPTY_LOG.copy(), [], tut_per_rep=5.0, formula="brzycki")
+
+    def test_unknown_formula_raises_error(self):
+        """An unknown formula should be rejected even for a 0-rep set."""
+        with pytest.raises(ValueError, match="formula must be one of"):
+            log_performance(_EMPTY_LOG.copy(), week=1, lift="Squat", weight=225, reps=0,
+                            total_tut=0, rpe=10, formula="lombardi")
+
+    def test_integral_float_week(self):
+        """A float week such as 2.0 should be logged like the int week."""
+        df = log_performance(_EMPTY_LOG.copy(), week=2.0, lift="Squat", weight=225, reps=10,
+                             total_tut=60, rpe=7)
+        assert df.iloc[0]['week'] == 2
+        assert df.iloc[0]['block'] == 1
+
+    def test_inplace_appends_to_same_dataframe(self):
+        """inplace=True should mutate and return the DataFrame that was passed in."""
+        df = _EMPTY_LOG.copy()
+        result = log_performance(df, week=1, lift="Squat", weight=225, reps=10,
+                                 total_tut=60, rpe=7, inplace=True)
+        log_performance(df, week=5, lift="Bench Press", weight=185, reps=12,
+                        total_tut=72, rpe=8, inplace=True)
+
+        assert result is df
+        assert len(df) == 2
+        assert df['lift'].tolist() == ["Squat", "Bench Press"]
+        assert df['block'].tolist() == [1, 2]
+        assert df.iloc[1]['estimated_1rm'] == pytest.approx(333.0)
+
+    @pytest.mark.parametrize("inplace", [False, True])
+    def test_keeps_compact_dtypes(self, inplace):
+        """Appending should keep the categorical lift and compact numeric columns."""
+        df = _EMPTY_LOG.copy()
+        expected_dtypes = df.dtypes
+        df = log_performance(df, week=1, lift="Squat", weight=225, reps=10,
+                             total_tut=60, rpe=7, inplace=inplace)
+        df = log_performance(df, week=1, lift="Pull-ups", weight=45, reps=12,
+                             total_tut=72, rpe=8, inplace=inplace)
+
+        pd.testing.assert_series_equal(df.dtypes, expected_dtypes)
+
+    @pytest.mark.parametrize("inplace", [False, True])
+    def test_unknown_lift_added_as_category(self, inplace):
+        """Lifts outside the program should extend the categories, not drop to object."""
+        df = _EMPTY_LOG.copy()
+        df = log_performance(df, week=1, lift="Squat", weight=225, reps=10,
+                             total_tut=60, rpe=7, inplace=inplace)
+        df = log_performance(df, week=1, lift="Deadlift", weight=315, reps=5,
+                             total_tut=30, rpe=8, inplace=inplace)
+
+        assert df['lift'].dtype == 'category'
+        assert df['lift'].cat.categories.tolist() == ["Squat", "Bench Press", "Pull-ups", "Deadlift"]
+        assert df['lift'].tolist() == ["Squat", "Deadlift"]
+
+    def test_default_does_not_mutate_input(self):
+        """Without inplace, the input DataFrame should be left unchanged."""
+        df = _EMPTY_LOG.copy()
+        log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+        assert len(df) == 0
+
+    def test_inplace_rejects_non_log_layout(self):
+        """inplace=True should refuse frames whose index could be overwritten."""
+        df = _EMPTY_LOG.copy()
+        df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+        df = log_performance(df, week=1, lift="Bench Press", weight=185, reps=12, total_tut=72, rpe=7)
+        bench_only = get_performance_by_lift(df, "Bench Press")
+
+        with pytest.raises(ValueError, match="inplace logging requires"):
+            log_performance(bench_only, week=2, lift="Bench Press", weight=190, reps=10,
+                            total_tut=60, rpe=8, inplace=True)
+
+
+def _track_weekly(df, lift, **kwargs):
+    """track_weekly_performance() with log_performance()'s `lift` argument name."""
+    return track_weekly_performance(df, lift_name=lift, **kwargs)
+
+
+@pytest.fixture(params=[
+    pytest.param(log_performance, id="log_performance"),
+    pytest.param(_track_weekly, id="track_weekly_performance"),
+])
+def log_fn(request):
+    """Single-set logging entry point under test."""
+    return request.param
+
+
+class TestRecordValidation:
+    """Validation shared by log_performance() and track_weekly_performance()."""
+
+    VALID = dict(week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+
+    @pytest.mark.parametrize("overrides,pattern", [
+        pytest.param(dict(week=0), "week must be between 1 and 13", id="week-below"),
+        pytest.param(dict(week=14), "week must be between 1 and 13", id="week-above"),
+        pytest.param(dict(week=2.5), "week must be a whole number", id="fractional-week"),
+        pytest.param(dict(lift=""), "lift must be a non-empty string", id="empty-lift"),
+        pytest.param(dict(weight=0), "weight must be positive", id="zero-weight"),
+        pytest.param(dict(weight=-100), "weight must be positive", id="negative-weight"),
+        pytest.param(dict(reps=-1), "reps must be non-negative", id="negative-reps"),
+        pytest.param(dict(reps=8.5), "reps must be a whole number", id="fractional-reps"),
+        pytest.param(dict(reps=32768), "reps must be at most 32767", id="reps-overflow"),
+        pytest.param(dict(total_tut=-5), "total_tut must be non-negative", id="negative-tut"),
+        pytest.param(dict(rpe=0), "rpe must be between 1 and 10", id="rpe-below"),
+        pytest.param(dict(rpe=11), "rpe must be between 1 and 10", id="rpe-above"),
+    ])
+    def test_invalid_inputs_raise_error(self, log_fn, overrides, pattern):
+        """Should raise ValueError naming the invalid field."""
+        with pytest.raises(ValueError, match=pattern):
+            log_fn(_EMPTY_LOG.copy(), **{**self.VALID, **overrides})
+
+
+class TestLogPerformanceBatch:
+    """Test suite for log_performance_batch() function."""
+
+    RECORDS = [
+        {'week': 1, 'lift': "Squat", 'weight': 225, 'reps': 10, 'total_tut': 60, 'rpe': 7},
+        {'week': 5, 'lift': "Bench Press", 'weight': 185, 'reps': 12, 'total_tut': 72, 'rpe': 8},
+        {'week': 9, 'lift': "Squat", 'weight': 300, 'reps': 0, 'total_tut': 0, 'rpe': 10},
+    ]
+
+    # Same sets with float reps and weeks, as parsed from CSV/JSON
+    FLOAT_RECORDS = [
+        {**record, 'week': float(record['week']), 'reps': float(record['reps'])}
+        for record in RECORDS
+    ]
+
+    @pytest.mark.parametrize("records", [
+        pytest.param(RECORDS, id="int-reps"),
+        pytest.param(FLOAT_RECORDS, id="float-reps"),
+    ])
+    def test_matches_row_by_row_logging(self, records):
+        """Batch logging should produce the same rows and dtypes as repeated log_performance()."""
+        expected = _EMPTY_LOG.copy()
+        for record in records:
+            expected = log_performance(expected, **record)
+
+        df = log_performance_batch(_EMPTY_LOG.copy(), records)
+
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_zero_rep_sets_ignore_tempo(self):
+        """A 0-rep set should log with any tempo on both paths, as in estimate_1rm_from_amrap()."""
+        record = self.RECORDS[2]
+        expected = log_performance(_EMPTY_LOG.copy(), **record, tut_per_rep=0)
+
+        df = log_performance_batch(_EMPTY_LOG.copy(), [record], tut_per_rep=0)
+
+        pd.testing.assert_frame_equal(df, expected)
+        assert df.iloc[0]['estimated_1rm'] == 300
+
+    def test_appends_to_existing_log(self):
+        """Batch rows should be appended after existing records."""
+        df = _EMPTY_LOG.copy()
+        df = log_performance(df, week=1, lift="Pull-ups", weight=200, reps=15, total_tut=90, rpe=6)
+        df = log_performance_batch(df, self.RECORDS)
+
+        assert len(df) == 4
+        assert df['lift'].tolist() == ["Pull-ups", "Squat", "Bench Press", "Squat"]
+        assert df['block'].tolist() == [1, 1, 2, 3]
+
+    def test_accepts_dataframe_records(self):
+        """A DataFrame of records should log the same rows as a list of dicts."""
+        expected = log_performance_batch(_EMPTY_LOG.copy(), self.RECORDS)
+        df = log_performance_batch(_EMPTY_LOG.copy(), pd.DataFrame(self.RECORDS))
+
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_custom_tut_parameters(self):
+        """Custom TUT parameters should apply to the whole batch."""
+        df = log_performance_batch(_EMPTY_LOG.copy(), self.RECORDS[:1],
+                                   tut_per_rep=5.0, normal_tempo=2.5)
+        assert df.iloc[0]['estimated_1rm'] == pytest.approx(375.0)
+
+    def test_accepts_logger(self):
+        """Batch logging into a PerformanceLogger should buffer all records."""
+        logger = PerformanceLogger()
+        result = log_performance_batch(logger, self.RECORDS)
+
+        assert result is logger
+        assert len(logger) == 3
+        np.testing.assert_allclose(logger.to_df()['estimated_1rm'].to_numpy(), [375.0, 333.0, 300.0])
+
+    @pytest.mark.parametrize("records", [
+        pytest.param(RECORDS, id="int-reps"),
+        pytest.param(FLOAT_RECORDS, id="float-reps"),
+    ])
+    def test_formula_matches_row_by_row_logging(self, records):
+        """A non-default formula should give the same rows and dtypes as repeated log_performance()."""
+        expected = _EMPTY_LOG.copy()
+        for record in records:
+            expected = log_performance(expected, formula="brzycki", **record)
+
+        df = log_performance_batch(_EMPTY_LOG.copy(), records, formula="brzycki")
+
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_unknown_formula_raises_error_for_empty_batch(self):
+        """An unknown formula should be rejected even when there are no records."""
+        with pytest.raises(ValueError, match="formula must be one of"):
+            log_performance_batch(_EMPTY_LOG.copy(), [], formula="lombardi")
+
+    @pytest.mark.parametrize("bad_fields,pattern", [
+        pytest.param({'week': 0}, "week must be between 1 and 13", id="week"),
+        pytest.param({'week': 2.5}, "week must be a whole number", id="fractional-week"),
+        pytest.param({'lift': "  "}, "lift must be a non-empty string", id="lift"),
+        pytest.param({'weight': 0}, "weight must be positive", id="weight"),
+        pytest.param({'reps': -1}, "reps must be non-negative", id="reps"),
+        pytest.param({'reps': 8.5}, "reps must be a whole number", id="fractional-reps"),
+        pytest.param({'reps': 40000}, "reps must be at most 32767", id="reps-overflow"),
+        pytest.param({'total_tut': -5}, "total_tut must be non-negative", id="total_tut"),
+        pytest.param({'rpe': float('nan')}, "rpe must be between 1 and 10", id="rpe-nan"),
+        pytest.param({'weight': -1, 'rpe': 11}, "weight must be positive", id="first-field-wins"),
+        pytest.param({'week': 2.5, 'weight': -1}, "week must be a whole number", id="week-checked-first"),
+    ])
+    def test_batch_validation_matches_log_performance(self, bad_fields, pattern):
+        """Batch validation should raise the same message as log_performance() for a bad record."""
+        bad_record = {**self.RECORDS[1], **bad_fields}
+        with pytest.raises(ValueError, match=pattern):
+            log_performance(_EMPTY_LOG.copy(), **bad_record)
+        with pytest.raises(ValueError, match=pattern):
+            log_performance_batch(_EMPTY_LOG.copy(), [self.RECORDS[0], bad_record])
+
+    def test_invalid_record_rejects_batch(self):
+        """An invalid record should raise and leave the log unchanged."""
+        records = self.RECORDS + [
+            {'week': 14, 'lift': "Squat", 'weight': 225, 'reps': 10, 'total_tut': 60, 'rpe': 7}
+        ]
+        logger = PerformanceLogger()
         with pytest.raises(ValueError, match="week must be between 1 and 13"):
-            log_performance(df, week=0, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+            log_performance_batch(logger, records)
+
+        assert len(logger) == 0
+
+
+class TestPerformanceLogger:
+    """Test suite for the buffered PerformanceLogger."""
 
-    def test_invalid_week_above_range(self):
-        """Should raise ValueError for week > 13."""
-        df = initialize_performance_log()
+    def test_starts_empty(self):
+        """A new logger should have no records and an empty, correctly shaped DataFrame."""
+        logger = PerformanceLogger()
+        assert len(logger) == 0
+
+        df = logger.to_df()
+        assert len(df) == 0
+        assert df.columns.tolist() == _EMPTY_LOG.columns.tolist()
+
+    def test_log_buffers_records(self):
+        """log() should buffer records that to_df() materializes in order."""
+        logger = PerformanceLogger()
+        logger.log(week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+        logger.log(week=5, lift="Bench Press", weight=185, reps=12, total_tut=72, rpe=8)
+
+        df = logger.to_df()
+        assert len(logger) == 2
+        assert df['lift'].tolist() == ["Squat", "Bench Press"]
+        assert df['block'].tolist() == [1, 2]
+        np.testing.assert_allclose(df['estimated_1rm'].to_numpy(), [375.0, 333.0])
+
+    def test_matches_dataframe_path(self):
+        """Logger output should match rows appended to a DataFrame."""
+        rows = [
+            dict(week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7),
+            dict(week=2, lift="Squat", weight=240, reps=8, total_tut=48, rpe=8.5),
+        ]
+        logger = PerformanceLogger()
+        df = _EMPTY_LOG.copy()
+        for row in rows:
+            logger.log(**row)
+            df = log_performance(df, **row)
+
+        pd.testing.assert_frame_equal(logger.to_df().astype({'lift': object}),
+                                      df.astype({'lift': object}), check_dtype=False)
+
+    def test_compact_dtypes(self):
+        """Materialized columns should use compact dtypes and a categorical lift."""
+        logger = PerformanceLogger()
+        logger.log(week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+        df = logger.to_df()
+
+        assert df['week'].dtype == 'int8'
+        assert df['block'].dtype == 'int8'
+        assert df['lift'].dtype == 'category'
+        assert df['reps'].dtype == 'int16'
+        assert df['weight'].dtype == 'float32'
+        assert df['estimated_1rm'].dtype == 'float32'
+
+    def test_grows_past_initial_capacity(self):
+        """Logging more rows than the initial capacity should keep every record."""
+        logger = PerformanceLogger(capacity=2)
+        lifts = ["Squat", "Bench Press", "Pull-ups"]
+        for i in range(10):
+            logger.log(week=i + 1, lift=lifts[i % 3], weight=100 + i, reps=10, total_tut=60, rpe=7)
+
+        df = logger.to_df()
+        assert len(logger) == 10
+        assert df['week'].tolist() == list(range(1, 11))
+        assert df['weight'].tolist() == [100.0 + i for i in range(10)]
+        assert df['lift'].tolist() == [lifts[i % 3] for i in range(10)]
+
+    @pytest.mark.parametrize("copy", [True, False])
+    def test_to_df_copy_flag(self, copy):
+        """to_df(copy=False) should wrap the buffered columns; the default should not."""
+        logger = PerformanceLogger()
+        logger.log(week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+        df = logger.to_df(copy=copy)
+
+        assert np.shares_memory(df['weight'].to_numpy(), logger._columns['weight']) is not copy
+        pd.testing.assert_frame_equal(df, logger.to_df())
+
+    def test_latest_1rm_matches_dataframe_path(self):
+        """Cached latest 1RMs should match scanning the materialized log, for every lift."""
+        logger = PerformanceLogger(capacity=4)
+        for i in range(100):
+            logger.log(week=13 - i % 13, lift=f"Lift {i % 10}", weight=100 + i, reps=10,
+                       total_tut=60, rpe=7)
+        log_performance_batch(logger, [
+            {'week': 13, 'lift': "Lift 0", 'weight': 150, 'reps': 5, 'total_tut': 30, 'rpe': 9},
+        ])
+
+        df = logger.to_df()
+        for lift in [f"Lift {i}" for i in range(10)] + ["Deadlift"]:
+            assert get_latest_1rm_by_lift(logger, lift) == get_latest_1rm_by_lift(df, lift)
+
+    def test_log_performance_accepts_logger(self):
+        """log_performance() should append to a logger in place and return it."""
+        logger = PerformanceLogger()
+        result = log_performance(logger, week=1, lift="Squat", weight=225, reps=10,
+                                 total_tut=60, rpe=7)
+        result = track_weekly_performance(result, week=1, lift_name="Bench Press",
+                                          weight=185, reps=12, total_tut=72, rpe=7)
+
+        assert result is logger
+        assert len(logger) == 2
+
+    def test_log_validates_inputs(self):
+        """Invalid records should be rejected and not buffered."""
+        logger = PerformanceLogger()
         with pytest.raises(ValueError, match="week must be between 1 and 13"):
-            log_performance(df, week=14, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
-
-    def test_invalid_lift_empty_string(self):
-        """Should raise ValueError for empty lift name."""
-        df = initialize_performance_log()
-        with pytest.raises(ValueError, match="lift must be a non-empty string"):
-            log_performance(df, week=1, lift="", weight=225, reps=10, total_tut=60, rpe=7)
-
-    def test_invalid_weight(self):
-        """Should raise ValueError for non-positive weight."""
-        df = initialize_performance_log()
-        with pytest.raises(ValueError, match="weight must be positive"):
-            log_performance(df, week=1, lift="Squat", weight=0, reps=10, total_tut=60, rpe=7)
-
-        with pytest.raises(ValueError, match="weight must be positive"):
-            log_performance(df, week=1, lift="Squat", weight=-100, reps=10, total_tut=60, rpe=7)
-
-    def test_invalid_negative_reps(self):
-        """Should raise ValueError for negative reps."""
-        df = initialize_performance_log()
-        with pytest.raises(ValueError, match="reps must be non-negative"):
-            log_performance(df, week=1, lift="Squat", weight=225, reps=-1, total_tut=60, rpe=7)
-
-    def test_invalid_negative_tut(self):
-        """Should raise ValueError for negative TUT."""
-        df = initialize_performance_log()
-        with pytest.raises(ValueError, match="total_tut must be non-negative"):
-            log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=-5, rpe=7)
-
-    def test_invalid_rpe_below_range(self):
-        """Should raise ValueError for RPE < 1."""
-        df = initialize_performance_log()
+            logger.log(week=14, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
         with pytest.raises(ValueError, match="rpe must be between 1 and 10"):
-            log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=0)
+            logger.log(week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=11)
+        with pytest.raises(ValueError, match="reps must be at most 32767"):
+            logger.log(week=1, lift="Squat", weight=225, reps=40000, total_tut=60, rpe=7)
 
-    def test_invalid_rpe_above_range(self):
-        """Should raise ValueError for RPE > 10."""
-        df = initialize_performance_log()
-        with pytest.raises(ValueError, match="rpe must be between 1 and 10"):
-            log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=11)
+        assert len(logger) == 0
+
+    def test_save_logger(self, log_dir):
+        """save_performance_log() should accept a logger directly."""
+        logger = PerformanceLogger()
+        logger.log(week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+
+        filepath = log_dir / "logger_log.csv"
+        save_performance_log(logger, filepath)
+
+        loaded_df = load_performance_log(filepath)
+        assert len(loaded_df) == 1
+        assert loaded_df.iloc[0]['lift'] == "Squat"
 
 
 class TestTrackWeeklyPerformance:
@@ -215,7 +595,7 @@ class TestTrackWeeklyPerformance:
 
     def test_adds_single_record(self):
         """Should successfully add a single record using lift_name parameter."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         df = track_weekly_performance(df, week=1, lift_name="Squat", weight=225.0,
                                      reps=10, total_tut=60.0, rpe=7.5)
 
@@ -229,7 +609,7 @@ class TestTrackWeeklyPerformance:
 
     def test_auto_calculates_block_and_1rm(self):
         """Should automatically calculate block and estimated 1RM."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         df = track_weekly_performance(df, week=5, lift_name="Bench Press", weight=185,
                                      reps=12, total_tut=72, rpe=8.0)
 
@@ -239,7 +619,7 @@ class TestTrackWeeklyPerformance:
 
     def test_handles_multiple_lifts(self):
         """Should handle different lift names correctly."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         df = track_weekly_performance(df, week=1, lift_name="Squat", weight=225,
                                      reps=10, total_tut=60, rpe=7)
         df = track_weekly_performance(df, week=1, lift_name="Bench Press", weight=185,
@@ -252,33 +632,9 @@ class TestTrackWeeklyPerformance:
         assert df.iloc[1]['lift'] == "Bench Press"
         assert df.iloc[2]['lift'] == "Pull-ups"
 
-    def test_validation_errors(self):
-        """Should raise appropriate errors for invalid inputs."""
-        df = initialize_performance_log()
-
-        # Invalid week
-        with pytest.raises(ValueError, match="week must be between 1 and 13"):
-            track_weekly_performance(df, week=0, lift_name="Squat", weight=225,
-                                   reps=10, total_tut=60, rpe=7)
-
-        # Invalid lift name
-        with pytest.raises(ValueError, match="lift must be a non-empty string"):
-            track_weekly_performance(df, week=1, lift_name="", weight=225,
-                                   reps=10, total_tut=60, rpe=7)
-
-        # Invalid weight
-        with pytest.raises(ValueError, match="weight must be positive"):
-            track_weekly_performance(df, week=1, lift_name="Squat", weight=0,
-                                   reps=10, total_tut=60, rpe=7)
-
-        # Invalid RPE
-        with pytest.raises(ValueError, match="rpe must be between 1 and 10"):
-            track_weekly_performance(df, week=1, lift_name="Squat", weight=225,
-                                   reps=10, total_tut=60, rpe=11)
-
     def test_complete_workout_logging(self):
         """Test logging a complete workout with multiple sets."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
 
         # Log all sets from a squat workout
         df = track_weekly_performance(df, week=2, lift_name="Squat", weight=240,
@@ -289,9 +645,9 @@ class TestTrackWeeklyPerformance:
                                      reps=8, total_tut=48, rpe=8.5)
 
         assert len(df) == 3
-        assert all(df['week'] == 2)
-        assert all(df['lift'] == "Squat")
-        assert all(df['weight'] == 240)
+        assert df['week'].eq(2).all()
+        assert df['lift'].eq("Squat").all()
+        assert df['weight'].eq(240).all()
 
         # Verify RPE progression (fatigue across sets)
         assert df.iloc[0]['rpe'] == 7.0
@@ -304,52 +660,132 @@ class TestSaveAndLoadPerformanceLog:
 
     def test_save_and_load_roundtrip(self):
         """Should save and load data without loss."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "test_log.csv"
+        buffer = io.StringIO()
+
+        # Create and save log
+        df = _EMPTY_LOG.copy()
+        df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7.5)
+        df = log_performance(df, week=1, lift="Bench Press", weight=185, reps=12, total_tut=72, rpe=8)
+        save_performance_log(df, buffer)
+
+        # Load and verify
+        buffer.seek(0)
+        loaded_df = load_performance_log(buffer)
+        assert len(loaded_df) == 2
+        assert loaded_df.iloc[0]['lift'] == "Squat"
+        assert loaded_df.iloc[1]['lift'] == "Bench Press"
+
+    def test_save_creates_parent_directories(self, monkeypatch):
+        """Should create missing parent directories before writing the file."""
+        # The mocked mkdir never creates the directory, so keep it out of the shared cache
+        monkeypatch.setattr(tracker, "_ensured_dirs", set())
+        filepath = Path("mocked-logs") / "subdir" / "test_log.csv"
+        df = _EMPTY_LOG.copy()
+        df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
 
-            # Create and save log
-            df = initialize_performance_log()
-            df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7.5)
-            df = log_performance(df, week=1, lift="Bench Press", weight=185, reps=12, total_tut=72, rpe=8)
+        with mock.patch.object(Path, "mkdir", autospec=True) as mkdir, \
+                mock.patch.object(pd.DataFrame, "to_csv", autospec=True) as to_csv:
             save_performance_log(df, filepath)
 
-            # Load and verify
-            loaded_df = load_performance_log(filepath)
-            assert len(loaded_df) == 2
-            assert loaded_df.iloc[0]['lift'] == "Squat"
-            assert loaded_df.iloc[1]['lift'] == "Bench Press"
+        mkdir.assert_called_once_with(filepath.parent, parents=True, exist_ok=True)
+        to_csv.assert_called_once_with(df, filepath, index=False)
 
-    def test_save_creates_parent_directories(self):
-        """Should create parent directories if they don't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "subdir" / "test_log.csv"
+    def test_repeated_saves_create_directory_once(self, log_dir, monkeypatch):
+        """Saving repeatedly into the same directory should only mkdir it once."""
+        calls = []
+        original_mkdir = Path.mkdir
 
-            df = initialize_performance_log()
-            df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
-            save_performance_log(df, filepath)
+        def counting_mkdir(self, *args, **kwargs):
+            calls.append(self)
+            return original_mkdir(self, *args, **kwargs)
 
-            assert filepath.exists()
-            loaded_df = load_performance_log(filepath)
-            assert len(loaded_df) == 1
+        monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+        df = _EMPTY_LOG.copy()
+        df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+        for _ in range(3):
+            save_performance_log(df, log_dir / "stream" / "test_log.csv")
 
-    def test_load_preserves_dtypes(self):
-        """Should preserve correct data types after loading."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = Path(tmpdir) / "test_log.csv"
+        assert calls == [log_dir / "stream"]
 
-            df = initialize_performance_log()
-            df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7.5)
-            save_performance_log(df, filepath)
+    def test_save_after_chdir_with_relative_path(self, tmp_path, monkeypatch):
+        """A relative directory cached under one cwd should still be created under another."""
+        df = log_performance(_EMPTY_LOG.copy(), week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+        first, second = tmp_path / "first", tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+
+        monkeypatch.chdir(first)
+        save_performance_log(df, Path("logs") / "test_log.csv")
+        monkeypatch.chdir(second)
+        save_performance_log(df, Path("logs") / "test_log.csv")
+
+        assert (first / "logs" / "test_log.csv").exists()
+        assert (second / "logs" / "test_log.csv").exists()
+
+    def test_save_recreates_deleted_directory(self, tmp_path):
+        """A cached directory removed between saves should be recreated."""
+        df = log_performance(_EMPTY_LOG.copy(), week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+        filepath = tmp_path / "removed" / "test_log.csv"
+        save_performance_log(df, filepath)
+        shutil.rmtree(filepath.parent)
+
+        save_performance_log(df, filepath)
 
-            loaded_df = load_performance_log(filepath)
-            assert loaded_df['week'].dtype == 'int64'
-            assert loaded_df['block'].dtype == 'int64'
-            assert loaded_df['lift'].dtype == 'object'
-            assert loaded_df['weight'].dtype == 'float64'
-            assert loaded_df['reps'].dtype == 'int64'
-            assert loaded_df['total_tut'].dtype == 'float64'
-            assert loaded_df['rpe'].dtype == 'float64'
-            assert loaded_df['estimated_1rm'].dtype == 'float64'
+        assert len(load_performance_log(filepath)) == 1
+
+    def test_empty_log_round_trips_schema(self):
+        """A saved empty log should load back with the initialize_performance_log() dtypes."""
+        buffer = io.StringIO()
+        save_performance_log(_EMPTY_LOG, buffer)
+
+        buffer.seek(0)
+        pd.testing.assert_frame_equal(load_performance_log(buffer), _EMPTY_LOG)
+
+    def test_load_preserves_dtypes(self):
+        """Should preserve correct data types after loading."""
+        buffer = io.StringIO()
+
+        df = _EMPTY_LOG.copy()
+        df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7.5)
+        save_performance_log(df, buffer)
+
+        buffer.seek(0)
+        loaded_df = load_performance_log(buffer)
+        assert loaded_df['week'].dtype == 'int8'
+        assert loaded_df['block'].dtype == 'int8'
+        assert loaded_df['lift'].dtype == 'category'
+        assert loaded_df['weight'].dtype == 'float32'
+        assert loaded_df['reps'].dtype == 'int16'
+        assert loaded_df['total_tut'].dtype == 'float32'
+        assert loaded_df['rpe'].dtype == 'float32'
+        assert loaded_df['estimated_1rm'].dtype == 'float32'
+
+    @pytest.mark.parametrize("filename", ["test_log.feather", "test_log.arrow", "test_log.parquet"])
+    def test_binary_roundtrip_preserves_dtypes(self, log_dir, filename):
+        """Feather/Parquet round trips should keep rows and the compact schema."""
+        pytest.importorskip("pyarrow")
+        filepath = log_dir / filename
+
+        df = _EMPTY_LOG.copy()
+        df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7.5)
+        df = log_performance(df, week=5, lift="Bench Press", weight=185, reps=12, total_tut=72, rpe=8)
+        save_performance_log(df, filepath)
+
+        loaded_df = load_performance_log(filepath)
+        pd.testing.assert_frame_equal(loaded_df, df)
+
+    def test_parquet_uses_zstd_and_dictionary_lifts(self, log_dir):
+        """Parquet saves should be zstd-compressed and load lift back as a category."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        filepath = log_dir / "zstd_log.parquet"
+
+        df = _EMPTY_LOG.copy()
+        df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7.5)
+        save_performance_log(df, filepath)
+
+        column = pq.ParquetFile(filepath).metadata.row_group(0).column(0)
+        assert column.compression == "ZSTD"
+        assert load_performance_log(filepath)['lift'].dtype == 'category'
 
     def test_load_nonexistent_file(self):
         """Should raise FileNotFoundError for missing file."""
@@ -357,47 +793,58 @@ class TestSaveAndLoadPerformanceLog:
             load_performance_log("nonexistent_file.csv")
 
 
-class TestFilteringFunctions:
-    """Test suite for filtering helper functions."""
-
-    @pytest.fixture
-    def sample_log(self):
-        """Create a sample performance log for testing."""
-        df = initialize_performance_log()
+@pytest.fixture(scope="session")
+def sample_log():
+    """Sample performance log shared by the filtering tests; treat as read-only."""
+    return _bulk_log([
         # Week 1 - Block 1
-        df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
-        df = log_performance(df, week=1, lift="Bench Press", weight=185, reps=12, total_tut=72, rpe=7)
+        (1, "Squat", 225, 10, 60, 7),
+        (1, "Bench Press", 185, 12, 72, 7),
         # Week 2 - Block 1
-        df = log_performance(df, week=2, lift="Squat", weight=240, reps=8, total_tut=48, rpe=8)
-        df = log_performance(df, week=2, lift="Bench Press", weight=200, reps=10, total_tut=60, rpe=8)
+        (2, "Squat", 240, 8, 48, 8),
+        (2, "Bench Press", 200, 10, 60, 8),
         # Week 5 - Block 2
-        df = log_performance(df, week=5, lift="Squat", weight=255, reps=7, total_tut=42, rpe=8.5)
-        df = log_performance(df, week=5, lift="Pull-ups", weight=200, reps=15, total_tut=90, rpe=6)
-        return df
+        (5, "Squat", 255, 7, 42, 8.5),
+        (5, "Pull-ups", 200, 15, 90, 6),
+    ])
+
+
+class TestFilteringFunctions:
+    """Test suite for filtering helper functions."""
 
     def test_get_performance_by_lift(self, sample_log):
         """Should filter by lift correctly."""
         squat_data = get_performance_by_lift(sample_log, "Squat")
         assert len(squat_data) == 3
-        assert all(squat_data['lift'] == "Squat")
+        assert squat_data['lift'].eq("Squat").all()
 
         bench_data = get_performance_by_lift(sample_log, "Bench Press")
         assert len(bench_data) == 2
-        assert all(bench_data['lift'] == "Bench Press")
+        assert bench_data['lift'].eq("Bench Press").all()
+
+    @pytest.mark.parametrize("lift,expected", [("Squat", 3), ("Deadlift", 0)])
+    def test_get_performance_by_lift_matches_object_dtype(self, sample_log, lift, expected):
+        """Category-code filtering should match plain string filtering."""
+        plain = sample_log.astype({'lift': object})
+        by_code = get_performance_by_lift(sample_log, lift)
+        by_string = get_performance_by_lift(plain, lift)
+
+        assert len(by_code) == len(by_string) == expected
+        assert by_code.index.tolist() == by_string.index.tolist()
 
     def test_get_performance_by_week(self, sample_log):
         """Should filter by week correctly."""
         week1_data = get_performance_by_week(sample_log, 1)
         assert len(week1_data) == 2
-        assert all(week1_data['week'] == 1)
+        assert week1_data['week'].eq(1).all()
 
         week5_data = get_performance_by_week(sample_log, 5)
         assert len(week5_data) == 2
-        assert all(week5_data['week'] == 5)
+        assert week5_data['week'].eq(5).all()
 
     def test_get_performance_by_week_invalid(self):
         """Should raise ValueError for invalid week."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         with pytest.raises(ValueError, match="week must be between 1 and 13"):
             get_performance_by_week(df, 0)
 
@@ -405,15 +852,15 @@ class TestFilteringFunctions:
         """Should filter by block correctly."""
         block1_data = get_performance_by_block(sample_log, 1)
         assert len(block1_data) == 4
-        assert all(block1_data['block'] == 1)
+        assert block1_data['block'].eq(1).all()
 
         block2_data = get_performance_by_block(sample_log, 2)
         assert len(block2_data) == 2
-        assert all(block2_data['block'] == 2)
+        assert block2_data['block'].eq(2).all()
 
     def test_get_performance_by_block_invalid(self):
         """Should raise ValueError for invalid block."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         with pytest.raises(ValueError, match="block must be 1, 2, or 3"):
             get_performance_by_block(df, 0)
 
@@ -426,19 +873,92 @@ class TestFilteringFunctions:
         # Week 5 Squat: 7 reps at 255 lbs → effective reps = 14 → 255 * (1 + 14/30) = 374.0
         assert latest_squat == pytest.approx(374.0)
 
+    def test_get_latest_1rm_out_of_order_logging(self):
+        """Latest 1RM should come from the highest week, not the last row logged."""
+        df = _EMPTY_LOG.copy()
+        df = log_performance(df, week=3, lift="Squat", weight=240, reps=8, total_tut=48, rpe=8)
+        df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+
+        # Week 3: 240 * (1 + 16/30) = 368.0
+        assert get_latest_1rm_by_lift(df, "Squat") == pytest.approx(368.0)
+
+    def test_get_latest_1rm_same_week_uses_last_set(self):
+        """With several sets in the latest week, the last one logged should win."""
+        df = _EMPTY_LOG.copy()
+        df = log_performance(df, week=2, lift="Squat", weight=240, reps=10, total_tut=60, rpe=7)
+        df = log_performance(df, week=2, lift="Squat", weight=240, reps=8, total_tut=48, rpe=9)
+
+        assert get_latest_1rm_by_lift(df, "Squat") == pytest.approx(368.0)
+
     def test_get_latest_1rm_no_records(self):
         """Should return None when no records exist for lift."""
-        df = initialize_performance_log()
+        df = _EMPTY_LOG.copy()
         result = get_latest_1rm_by_lift(df, "Squat")
         assert result is None
 
     def test_filtering_returns_copies(self, sample_log):
         """Filtering functions should return copies, not views."""
-        filtered = get_performance_by_lift(sample_log, "Squat")
+        log = sample_log.copy()
+        filtered = get_performance_by_lift(log, "Squat")
         # Modify the filtered dataframe
         filtered.loc[filtered.index[0], 'rpe'] = 10
         # Original should be unchanged
-        assert sample_log.iloc[0]['rpe'] == 7
+        assert log.iloc[0]['rpe'] == 7
+
+    @pytest.mark.parametrize("lookup,key", [
+        (get_performance_by_lift, "Squat"),
+        (get_performance_by_week, 1),
+        (get_performance_by_block, 2),
+    ])
+    def test_copy_false_returns_same_rows(self, sample_log, lookup, key):
+        """Read-only callers passing copy=False should get the same rows, minus the extra copy."""
+        pd.testing.assert_frame_equal(lookup(sample_log, key, copy=False), lookup(sample_log, key))
+
+
+class TestBuildLiftIndex:
+    """Test suite for build_lift_index() function."""
+
+    def test_partitions_by_lift(self):
+        """Each lift should map to exactly its own records."""
+        df = _EMPTY_LOG.copy()
+        df = log_performance(df, week=1, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7)
+        df = log_performance(df, week=1, lift="Bench Press", weight=185, reps=12, total_tut=72, rpe=7)
+        df = log_performance(df, week=2, lift="Squat", weight=240, reps=8, total_tut=48, rpe=8)
+
+        index = build_lift_index(df)
+
+        assert set(index) == {"Squat", "Bench Press"}
+        pd.testing.assert_frame_equal(index["Squat"], get_performance_by_lift(df, "Squat"))
+        pd.testing.assert_frame_equal(index["Bench Press"], get_performance_by_lift(df, "Bench Press"))
+
+    def test_empty_log(self):
+        """An empty log should produce an empty index."""
+        assert build_lift_index(_EMPTY_LOG) == {}
+
+
+class TestBuildPerformanceIndex:
+    """Test suite for build_performance_index() function."""
+
+    @pytest.mark.parametrize("by,lookup,keys", [
+        ("week", get_performance_by_week, [1, 2, 5]),
+        ("block", get_performance_by_block, [1, 2]),
+    ])
+    def test_partitions_match_filters(self, sample_log, by, lookup, keys):
+        """Each group should equal the matching filter result, in first-seen order."""
+        index = build_performance_index(sample_log, by=by)
+
+        assert list(index) == keys
+        for key in keys:
+            pd.testing.assert_frame_equal(index[key], lookup(sample_log, key))
+
+    def test_defaults_to_lift(self, sample_log):
+        """The default partition should be by lift, like build_lift_index()."""
+        assert list(build_performance_index(sample_log)) == list(build_lift_index(sample_log))
+
+    def test_invalid_column(self, sample_log):
+        """Should raise ValueError for columns other than lift, week and block."""
+        with pytest.raises(ValueError, match="by must be one of: lift, week, block"):
+            build_performance_index(sample_log, by="rpe")
 
 
 class TestIntegration:
@@ -446,33 +966,38 @@ class TestIntegration:
 
     def test_complete_week_logging_workflow(self):
         """Test logging a complete week of training."""
-        df = initialize_performance_log()
-
-        # Week 1 - Day 1: Squat
-        df = log_performance(df, week=1, lift="Squat", weight=210, reps=12, total_tut=72, rpe=6)
-        df = log_performance(df, week=1, lift="Squat", weight=210, reps=11, total_tut=66, rpe=7)
-        df = log_performance(df, week=1, lift="Squat", weight=210, reps=10, total_tut=60, rpe=8)
-
-        # Week 1 - Day 2: Bench Press
-        df = log_performance(df, week=1, lift="Bench Press", weight=150, reps=12, total_tut=72, rpe=6)
-        df = log_performance(df, week=1, lift="Bench Press", weight=150, reps=12, total_tut=72, rpe=7)
-        df = log_performance(df, week=1, lift="Bench Press", weight=150, reps=11, total_tut=66, rpe=8)
+        df = _bulk_log([
+            # Week 1 - Day 1: Squat
+            (1, "Squat", 210, 12, 72, 6),
+            (1, "Squat", 210, 11, 66, 7),
+            (1, "Squat", 210, 10, 60, 8),
+            # Week 1 - Day 2: Bench Press
+            (1, "Bench Press", 150, 12, 72, 6),
+            (1, "Bench Press", 150, 12, 72, 7),
+            (1, "Bench Press", 150, 11, 66, 8),
+        ])
 
         assert len(df) == 6
         assert len(get_performance_by_lift(df, "Squat")) == 3
         assert len(get_performance_by_lift(df, "Bench Press")) == 3
+        np.testing.assert_allclose(df[['week', 'weight', 'rpe']].to_numpy(), [
+            [1, 210, 6], [1, 210, 7], [1, 210, 8],
+            [1, 150, 6], [1, 150, 7], [1, 150, 8],
+        ])
+        np.testing.assert_allclose(df['estimated_1rm'].to_numpy(), [378.0, 364.0, 350.0, 270.0, 270.0, 260.0])
 
     def test_multi_week_progression_tracking(self):
         """Test tracking progression across multiple weeks."""
-        df = initialize_performance_log()
-
         # Simulate 4 weeks of squat progression
-        df = log_performance(df, week=1, lift="Squat", weight=210, reps=10, total_tut=60, rpe=7)
-        df = log_performance(df, week=2, lift="Squat", weight=225, reps=10, total_tut=60, rpe=7.5)
-        df = log_performance(df, week=3, lift="Squat", weight=240, reps=8, total_tut=48, rpe=8)
-        df = log_performance(df, week=4, lift="Squat", weight=217.5, reps=12, total_tut=72, rpe=7)
+        df = _bulk_log([
+            (1, "Squat", 210, 10, 60, 7),
+            (2, "Squat", 225, 10, 60, 7.5),
+            (3, "Squat", 240, 8, 48, 8),
+            (4, "Squat", 217.5, 12, 72, 7),
+        ])
 
         squat_data = get_performance_by_lift(df, "Squat")
         assert len(squat_data) == 4
+        np.testing.assert_allclose(squat_data['estimated_1rm'].to_numpy(), [350.0, 375.0, 368.0, 391.5])
         # Verify 1RM is improving
         assert squat_data.iloc[1]['estimated_1rm'] > squat_data.iloc[0]['estimated_1rm']